@@ -5,11 +5,56 @@ Safely removes test files, debug files, and other unused files from the system.
 """
 
 import os
+import re
+import argparse
 import shutil
 import glob
+import fnmatch
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Deletion is syscall-bound, so threads overlap the unlink calls
+DELETE_WORKERS = 8
+
+def _compile_patterns(*patterns):
+    """Translate shell-style filename patterns into compiled regexes"""
+    return tuple(re.compile(fnmatch.translate(pattern)) for pattern in patterns)
+
+# Result JSON files with timestamps
+JSON_PATTERNS = _compile_patterns(
+    "*_results_*.json",
+    "*_comparison_*.json", 
+    "*_summary_*.json",
+    "phase*_*.json",
+    "*_test_results_*.json",
+    "extractor_*.json"
+)
+
+# Report files
+REPORT_PATTERNS = _compile_patterns(
+    "*.md",
+    "*_REPORT_*.md",
+    "*COMPLETION_REPORT*.md",
+    "*ENHANCEMENT*REPORT*.md",
+    "*SUMMARY*.md"
+)
+
+def list_files(path="."):
+    """List the visible regular files in a directory with a single scandir pass"""
+    with os.scandir(path) as entries:
+        return [entry.name for entry in entries
+                if not entry.name.startswith('.') and entry.is_file()]
+
+def match_files(filenames, patterns):
+    """Return the filenames matching any of the compiled patterns"""
+    return [name for name in filenames if any(p.match(name) for p in patterns)]
+
 def create_backup_log(files_to_delete):
     """Create a log of files being deleted for potential recovery"""
     log_data = {
@@ -18,28 +63,60 @@ def create_backup_log(files_to_delete):
         "cleanup_reason": "Codebase cleanup - removing test, debug, and unused files"
     }
     
-    with open('cleanup_log.json', 'w', encoding='utf-8') as f:
-        json.dump(log_data, f, indent=2, ensure_ascii=False)
+    # Serialize up front so the log goes out in a single write
+    if orjson is not None:
+        data = orjson.dumps(log_data, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(log_data, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    with open('cleanup_log.json', 'wb') as f:
+        f.write(data)
     
     print(f"📝 Backup log created: cleanup_log.json ({len(files_to_delete)} files)")
 
 def safe_delete_file(filepath):
-    """Safely delete a file with error handling"""
+    """Safely delete a file, returning (filepath, exception) with None on success"""
     try:
-        if os.path.exists(filepath):
-            os.remove(filepath)
-            return True
-        else:
-            print(f"⚠️  File not found: {filepath}")
-            return False
+        if not os.path.exists(filepath):
+            return filepath, FileNotFoundError(filepath)
+        os.remove(filepath)
+        return filepath, None
     except Exception as e:
-        print(f"❌ Error deleting {filepath}: {e}")
-        return False
+        return filepath, e
+
+def delete_files(filepaths, dry_run=False):
+    """Delete files concurrently, returning (filepath, exception) outcomes in input order"""
+    filepaths = list(filepaths)
+    if dry_run:
+        return [(path, None) for path in filepaths if os.path.exists(path)]
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+        return list(executor.map(safe_delete_file, filepaths))
+
+def report_deletions(outcomes, action):
+    """Print delete outcomes in input order, returning the deleted filepaths"""
+    deleted = []
+    for path, error in outcomes:
+        if error is None:
+            deleted.append(path)
+            print(f"  ✓ {action}: {path}")
+        elif isinstance(error, FileNotFoundError):
+            print(f"⚠️  File not found: {path}")
+        else:
+            print(f"❌ Error deleting {path}: {error}")
+    return deleted
 
-def safe_delete_directory(dirpath):
+def safe_delete_directory(dirpath, dry_run=False):
     """Safely delete a directory with error handling"""
     try:
         if os.path.exists(dirpath):
+            if dry_run:
+                return True
+            # Unlink the top-level files in parallel, then remove what is left
+            with os.scandir(dirpath) as entries:
+                outcomes = delete_files([entry.path for entry in entries if entry.is_file(follow_symlinks=False)])
+            for path, error in outcomes:
+                if error is not None:
+                    raise error
             shutil.rmtree(dirpath)
             return True
         else:
@@ -49,30 +126,35 @@ def safe_delete_directory(dirpath):
         print(f"❌ Error deleting directory {dirpath}: {e}")
         return False
 
-def cleanup_codebase():
+def cleanup_codebase(dry_run=False):
     """Main cleanup function"""
-    print("🧹 ResuAI Codebase Cleanup")
+    print("🧹 ResuAI Codebase Cleanup" + (" (dry run)" if dry_run else ""))
     print("=" * 50)
     
     files_deleted = []
+    action = "Would delete" if dry_run else "Deleted"
     
-    # 1. Test files (test_*.py)
+    # 1. History directory (VS Code history) - removed first since it holds
+    # most of the files, so none of the later steps can end up walking it
+    print("\n📁 Cleaning up .history directory...")
+    if safe_delete_directory(".history", dry_run):
+        files_deleted.append(".history/")
+        print(f"  ✓ {action}: .history/ directory")
+    
+    # One directory listing shared by every pattern-based step
+    cwd_files = list_files()
+    
+    # 2. Test files (test_*.py)
     print("\n📋 Cleaning up test files...")
     test_files = glob.glob("test_*.py")
-    for file in test_files:
-        if safe_delete_file(file):
-            files_deleted.append(file)
-            print(f"  ✓ Deleted: {file}")
+    files_deleted.extend(report_deletions(delete_files(test_files, dry_run), action))
     
-    # 2. Debug files (debug_*.py)
+    # 3. Debug files (debug_*.py)
     print("\n🐛 Cleaning up debug files...")
     debug_files = glob.glob("debug_*.py")
-    for file in debug_files:
-        if safe_delete_file(file):
-            files_deleted.append(file)
-            print(f"  ✓ Deleted: {file}")
+    files_deleted.extend(report_deletions(delete_files(debug_files, dry_run), action))
     
-    # 3. Fix/utility scripts
+    # 4. Fix/utility scripts
     print("\n🔧 Cleaning up fix/utility scripts...")
     fix_files = [
         "fix_imports.py",
@@ -80,32 +162,16 @@ def cleanup_codebase():
         "fix_app.py",
         "education_fix_summary.py"
     ]
-    for file in fix_files:
-        if safe_delete_file(file):
-            files_deleted.append(file)
-            print(f"  ✓ Deleted: {file}")
+    files_deleted.extend(report_deletions(delete_files(fix_files, dry_run), action))
     
-    # 4. Result JSON files with timestamps
+    # 5. Result JSON files with timestamps
     print("\n📊 Cleaning up result JSON files...")
-    json_patterns = [
-        "*_results_*.json",
-        "*_comparison_*.json", 
-        "*_summary_*.json",
-        "phase*_*.json",
-        "*_test_results_*.json",
-        "extractor_*.json"
-    ]
-    
-    for pattern in json_patterns:
-        json_files = glob.glob(pattern)
-        for file in json_files:
-            # Keep essential config files
-            if file not in ['package.json', 'tsconfig.json', 'analytics_data.json']:
-                if safe_delete_file(file):
-                    files_deleted.append(file)
-                    print(f"  ✓ Deleted: {file}")
+    # Keep essential config files
+    json_files = [file for file in match_files(cwd_files, JSON_PATTERNS)
+                  if file not in ['package.json', 'tsconfig.json', 'analytics_data.json']]
+    files_deleted.extend(report_deletions(delete_files(json_files, dry_run), action))
     
-    # 5. Specific files to remove
+    # 6. Specific files to remove
     print("\n🗂️ Cleaning up specific files...")
     specific_files = [
         "debug_raw_pds_data.json",
@@ -114,37 +180,16 @@ def cleanup_codebase():
         "utils_backup_before_class_removal.py"
     ]
     
-    for file in specific_files:
-        if safe_delete_file(file):
-            files_deleted.append(file)
-            print(f"  ✓ Deleted: {file}")
-    
-    # 6. History directory (VS Code history)
-    print("\n📁 Cleaning up .history directory...")
-    if safe_delete_directory(".history"):
-        files_deleted.append(".history/")
-        print("  ✓ Deleted: .history/ directory")
+    files_deleted.extend(report_deletions(delete_files(specific_files, dry_run), action))
     
     # 7. Report files
     print("\n📄 Cleaning up report files...")
-    report_patterns = [
-        "*.md",
-        "*_REPORT_*.md",
-        "*COMPLETION_REPORT*.md",
-        "*ENHANCEMENT*REPORT*.md",
-        "*SUMMARY*.md"
-    ]
-    
     # Keep essential documentation
     keep_files = ["README.md", "QUICK_START.md", "IMPLEMENTATION_GUIDE.md"]
     
-    for pattern in report_patterns:
-        report_files = glob.glob(pattern)
-        for file in report_files:
-            if file not in keep_files:
-                if safe_delete_file(file):
-                    files_deleted.append(file)
-                    print(f"  ✓ Deleted: {file}")
+    report_files = [file for file in match_files(cwd_files, REPORT_PATTERNS)
+                    if file not in keep_files]
+    files_deleted.extend(report_deletions(delete_files(report_files, dry_run), action))
     
     # 8. Migration files (keep schema files)
     print("\n🗄️ Cleaning up old migration files...")
@@ -157,10 +202,11 @@ def cleanup_codebase():
         "ocr_migration.sql"
     ]
     
-    for file in migration_files:
-        if safe_delete_file(file):
-            files_deleted.append(file)
-            print(f"  ✓ Deleted: {file}")
+    files_deleted.extend(report_deletions(delete_files(migration_files, dry_run), action))
+    
+    if dry_run:
+        print(f"\n✅ Dry run completed - {len(files_deleted)} files would be deleted")
+        return
     
     # Create backup log
     print(f"\n📝 Creating cleanup log...")
@@ -185,16 +231,27 @@ def cleanup_codebase():
     print(f"\n🚀 System is now clean and ready for Phase 3 development!")
 
 if __name__ == "__main__":
-    # Confirmation prompt
-    print("🧹 ResuAI Codebase Cleanup Script")
-    print("=" * 50)
-    print("This will delete test files, debug files, and other unused files.")
-    print("A backup log will be created for recovery if needed.")
-    print()
-    
-    response = input("Continue with cleanup? (y/N): ").strip().lower()
+    parser = argparse.ArgumentParser(description="Remove test, debug, and other unused files from the codebase")
+    parser.add_argument("-y", "--yes", action="store_true", help="skip the confirmation prompt")
+    parser.add_argument("--dry-run", action="store_true", help="list matching files without deleting anything")
+    args = parser.parse_args()
     
-    if response in ['y', 'yes']:
-        cleanup_codebase()
+    if args.dry_run:
+        cleanup_codebase(dry_run=True)
     else:
-        print("❌ Cleanup cancelled by user")
\ No newline at end of file
+        # Confirmation prompt
+        print("🧹 ResuAI Codebase Cleanup Script")
+        print("=" * 50)
+        print("This will delete test files, debug files, and other unused files.")
+        print("A backup log will be created for recovery if needed.")
+        print()
+        
+        if args.yes:
+            response = 'y'
+        else:
+            response = input("Continue with cleanup? (y/N): ").strip().lower()
+        
+        if response in ['y', 'yes']:
+            cleanup_codebase()
+        else:
+            print("❌ Cleanup cancelled by user")
@@ -7,7 +7,7 @@ import sys
 import os
 from database import DatabaseManager
 
-def debug_database_path():
+def debug_database_path(scan_all=False):
     print("🔍 Debugging Database Path")
     print("=" * 40)
     
@@ -28,6 +28,11 @@ def debug_database_path():
         else:
             print("No valid data from get_candidate")
         
+        # Scanning every candidate just to find one is expensive; opt in with --scan-all
+        if not scan_all:
+            print("\n⏭️  Skipping get_all_candidates() (pass --scan-all to compare)")
+            return
+        
         # Test getting all candidates
         print("\n🧪 Testing get_all_candidates()...")
         candidates = db.get_all_candidates()
@@ -52,4 +57,4 @@ def debug_database_path():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    debug_database_path()
\ No newline at end of file
+    debug_database_path(scan_all='--scan-all' in sys.argv[1:])
\ No newline at end of file
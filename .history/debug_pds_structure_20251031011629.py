@@ -7,73 +7,106 @@ import requests
 import json
 import sqlite3
 import os
+import functools
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+DB_PATH = os.path.join(os.path.dirname(__file__), 'resume_screening.db')
+
+# Subtrees decoded for inspection; other top-level keys are only listed
+PDS_SECTIONS = ('educational_background', 'work_experience', 'learning_development')
+
+@functools.lru_cache(maxsize=128)
+def _decode_pds(candidate_id, updated_at):
+    """Fetch a candidate's PDS top-level keys and decoded sections, cached per (candidate_id, updated_at)"""
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        # Let SQLite's JSON1 walk the blob so only the needed subtrees reach Python
+        rows = conn.execute("""
+            SELECT j.key, j.type,
+                   CASE WHEN j.key IN (?, ?, ?) OR j.key LIKE '%education%' THEN j.value END
+            FROM candidates c, json_each(c.pds_extracted_data) j
+            WHERE c.id = ?
+        """, (*PDS_SECTIONS, candidate_id)).fetchall()
+    finally:
+        conn.close()
+    
+    keys = []
+    sections = {}
+    for key, value_type, value in rows:
+        keys.append(key)
+        if key in PDS_SECTIONS or 'education' in key.lower():
+            if value_type in ('object', 'array'):
+                value = _json_loads(value)
+            sections[key] = value
+    return keys, sections
 
 def get_candidate_pds_data():
     """Get the actual PDS data structure from the database"""
     
     try:
         # Use SQLite database
-        db_path = os.path.join(os.path.dirname(__file__), 'resume_screening.db')
-        if not os.path.exists(db_path):
-            print(f"❌ Database not found at {db_path}")
+        if not os.path.exists(DB_PATH):
+            print(f"❌ Database not found at {DB_PATH}")
             return None
             
         # Connect to SQLite database
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(DB_PATH)
         
         cursor = conn.cursor()
         
         # Get candidate 4's PDS data (from the available candidates)
         cursor.execute("""
-            SELECT name, pds_extracted_data 
+            SELECT name, updated_at 
             FROM candidates 
             WHERE id = 4
         """)
         
         result = cursor.fetchone()
         if result:
-            name, pds_data = result
+            name, updated_at = result
             print(f"=== CANDIDATE: {name} ===")
             
-            if isinstance(pds_data, str):
-                pds_dict = json.loads(pds_data)
-            else:
-                pds_dict = pds_data
+            # Decoded sections are reused until the row's updated_at changes
+            keys, sections = _decode_pds(4, updated_at)
                 
             print("\n=== PDS DATA STRUCTURE ===")
-            print(f"Top-level keys: {list(pds_dict.keys()) if isinstance(pds_dict, dict) else type(pds_dict)}")
+            print(f"Top-level keys: {keys}")
             
-            if isinstance(pds_dict, dict):
-                # Check educational_background structure
-                edu_bg = pds_dict.get('educational_background', None)
-                print(f"\n=== EDUCATIONAL_BACKGROUND ===")
-                print(f"Type: {type(edu_bg)}")
-                print(f"Value: {edu_bg}")
-                
-                if isinstance(edu_bg, list) and edu_bg:
-                    print(f"First education entry: {edu_bg[0]}")
-                    if isinstance(edu_bg[0], dict):
-                        print(f"Education entry keys: {list(edu_bg[0].keys())}")
-                
-                # Check other relevant fields
-                print(f"\n=== OTHER EDUCATION FIELDS ===")
-                for key in pds_dict.keys():
-                    if 'education' in key.lower():
-                        print(f"{key}: {pds_dict[key]}")
-                        
-                # Check experience structure
-                work_exp = pds_dict.get('work_experience', None)
-                print(f"\n=== WORK_EXPERIENCE ===")
-                print(f"Type: {type(work_exp)}")
-                if isinstance(work_exp, list) and work_exp:
-                    print(f"First work entry: {work_exp[0]}")
+            # Check educational_background structure
+            edu_bg = sections.get('educational_background', None)
+            print(f"\n=== EDUCATIONAL_BACKGROUND ===")
+            print(f"Type: {type(edu_bg)}")
+            print(f"Value: {edu_bg}")
+            
+            if isinstance(edu_bg, list) and edu_bg:
+                print(f"First education entry: {edu_bg[0]}")
+                if isinstance(edu_bg[0], dict):
+                    print(f"Education entry keys: {list(edu_bg[0].keys())}")
+            
+            # Check other relevant fields (already filtered by the LIKE clause)
+            print(f"\n=== OTHER EDUCATION FIELDS ===")
+            for key, value in sections.items():
+                if 'education' in key.lower():
+                    print(f"{key}: {value}")
                     
-                # Check training structure
-                training = pds_dict.get('learning_development', None)
-                print(f"\n=== LEARNING_DEVELOPMENT ===")
-                print(f"Type: {type(training)}")
-                if isinstance(training, list) and training:
-                    print(f"First training entry: {training[0]}")
+            # Check experience structure
+            work_exp = sections.get('work_experience', None)
+            print(f"\n=== WORK_EXPERIENCE ===")
+            print(f"Type: {type(work_exp)}")
+            if isinstance(work_exp, list) and work_exp:
+                print(f"First work entry: {work_exp[0]}")
+                
+            # Check training structure
+            training = sections.get('learning_development', None)
+            print(f"\n=== LEARNING_DEVELOPMENT ===")
+            print(f"Type: {type(training)}")
+            if isinstance(training, list) and training:
+                print(f"First training entry: {training[0]}")
         else:
             print("❌ Candidate 4 not found")
             
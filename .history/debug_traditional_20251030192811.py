@@ -9,7 +9,60 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from assessment_engine import UniversityAssessmentEngine
 from database import DatabaseManager
+from psycopg2.extras import RealDictCursor
 import traceback
+import json
+
+# PDS sections stored as separate columns on pds_candidates
+PDS_CANDIDATE_SECTIONS = ('personal_info', 'educational_background', 'civil_service_eligibility',
+                          'work_experience', 'learning_development', 'other_information')
+
+def load_job_postings(db_manager):
+    """Fetch every LSPU job posting in a single query, returning (columns, postings by id)"""
+    with db_manager.get_connection() as conn:
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        cursor.execute("SELECT * FROM lspu_job_postings")
+        # Column names come with the result set, no catalog query needed
+        columns = [column[0] for column in cursor.description]
+        return columns, {row['id']: row for row in cursor.fetchall()}
+
+def _parse_json(value):
+    """Decode a JSON text column; JSONB columns already arrive decoded"""
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return None
+    return value
+
+def fetch_candidate_pds(db_manager, candidate_id):
+    """Fetch a candidate's PDS data from both candidate tables in a single query"""
+    with db_manager.get_connection() as conn:
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        # Prepared once per pooled connection, later lookups skip planning
+        db_manager.execute_prepared(cursor, 'fetch_candidate_pds', f"""
+            SELECT c.id AS candidate_id, c.name, c.pds_extracted_data, c.pds_data,
+                   p.id AS pds_candidate_id, {', '.join('p.' + col for col in PDS_CANDIDATE_SECTIONS)}
+            FROM (SELECT $1::int AS cid) x
+            LEFT JOIN candidates c ON c.id = x.cid
+            LEFT JOIN pds_candidates p ON p.id = x.cid
+        """, (candidate_id,))
+        row = cursor.fetchone()
+    
+    candidate = None
+    if row['candidate_id'] is not None:
+        candidate = {
+            'name': row['name'],
+            # Mirror get_candidate(): pds_extracted_data takes precedence over pds_data
+            'pds_data': _parse_json(row['pds_extracted_data']) or _parse_json(row['pds_data']) or {}
+        }
+    
+    pds_candidate = None
+    if row['pds_candidate_id'] is not None:
+        sections = {col: _parse_json(row[col]) for col in PDS_CANDIDATE_SECTIONS}
+        pds_candidate = {'pds_data': {key: value for key, value in sections.items() if value}}
+    
+    return candidate, pds_candidate
 
 def debug_traditional_assessment():
     """Debug why traditional assessment is returning 0"""
@@ -22,14 +75,20 @@ def debug_traditional_assessment():
         
         print("✅ Assessment engine created")
         
+        # Pre-fetch all job postings once so repeated lookups skip the round-trip
+        job_columns, job_postings = load_job_postings(db_manager)
+        print(f"📋 lspu_job_postings columns: {job_columns}")
+        
         # Get the same data that was used in the test
         candidate_id = 469
         job_id = 2
         
+        # Look the candidate up in both the candidates and pds_candidates tables at once
+        candidate_raw, pds_candidate = fetch_candidate_pds(db_manager, candidate_id)
+        
         # Check regular candidates table first
-        candidate_raw = db_manager.get_candidate(candidate_id)
         if candidate_raw:
-            print(f"✅ Found in candidates table: {candidate_raw.get('first_name')} {candidate_raw.get('last_name')}")
+            print(f"✅ Found in candidates table: {candidate_raw.get('name')}")
             # Check if PDS data is in the candidates table
             if candidate_raw.get('pds_data'):
                 pds_data = candidate_raw['pds_data']
@@ -40,8 +99,6 @@ def debug_traditional_assessment():
             print(f"❌ No candidate found in candidates table with ID {candidate_id}")
         
         # Also check the pds_candidates table
-        pds_candidate = db_manager.get_pds_candidate(candidate_id)
-        
         if pds_candidate and pds_candidate.get('pds_data'):
             pds_data = pds_candidate['pds_data']
             print(f"✅ PDS data found in pds_candidates table with keys: {list(pds_data.keys())}")
@@ -61,30 +118,14 @@ def debug_traditional_assessment():
             pds_data = pds_candidate['pds_data']
             print("📊 Using PDS data from pds_candidates table")
         
-        # Fetch LSPU job posting - check what columns exist first
-        with db_manager.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Check what columns exist
-            cursor.execute("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = 'lspu_job_postings'
-            """)
-            column_results = cursor.fetchall()
-            columns = [row[0] for row in column_results]
-            print(f"📋 lspu_job_postings columns: {columns}")
-            
-            # Get job data with available columns
-            cursor.execute("SELECT * FROM lspu_job_postings WHERE id = %s", (job_id,))
-            job_result = cursor.fetchone()
-            
-            if job_result:
-                job_posting = dict(zip(columns, job_result))
-                print(f"✅ Found job: {job_posting.get('position_title')}")
-            else:
-                print(f"❌ No job found with ID {job_id}")
-                return
+        # Get job data from the pre-fetched postings
+        job_posting = job_postings.get(job_id)
+        
+        if job_posting:
+            print(f"✅ Found job: {job_posting.get('position_title')}")
+        else:
+            print(f"❌ No job found with ID {job_id}")
+            return
         
         # Test traditional assessment directly
         print(f"\n🧪 Testing assess_candidate_for_lspu_job...")
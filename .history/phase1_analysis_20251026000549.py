@@ -11,11 +11,99 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from collections import Counter, defaultdict
+from collections import defaultdict
 import os
-import json
+import re
+import pickle
+import hashlib
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from utils import SemanticAnalyzer, PersonalDataSheetProcessor
 from improved_pds_extractor import ImprovedPDSExtractor
+from report_writer import write_json_report
+
+# Keywords that reveal one PDS section's data leaking into another
+_ELIGIBILITY_IN_WORK_RE = re.compile(r'eligibility|civil service|prc license')
+_WORK_IN_ELIGIBILITY_RE = re.compile(r'company|position|salary|supervisor')
+
+def _values_lower(entry):
+    """Lower-cased text of an entry's values, without its key names"""
+    return ' '.join(str(value) for value in entry.values()).lower()
+
+def _to_native(value):
+    """Convert numpy scalars and timestamps in nested results to JSON-native types"""
+    if isinstance(value, dict):
+        return {key: _to_native(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_native(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+def _extract_pds_file(filename):
+    """Extract one PDS file with a fresh ImprovedPDSExtractor (runs in a worker process)"""
+    return ImprovedPDSExtractor().extract_pds_data(filename)
+
+@lru_cache(maxsize=1)
+def _get_sentence_model(model_name='all-MiniLM-L6-v2'):
+    """Load a SentenceTransformer once and reuse it across analyzer runs"""
+    import torch
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name, device='cuda' if torch.cuda.is_available() else 'cpu')
+
+def _embed_cached(model, texts, model_name, cache_file=os.path.join('semantic_cache', 'phase1_probe_embeddings.pkl')):
+    """
+    Encode texts, reusing embeddings pickled by earlier runs
+    
+    Embeddings are keyed by model name and SHA-1 of the text; only texts not
+    in the cache are encoded, and the cache is written back if any were.
+    Encoding runs without autograd, and under fp16 autocast on CUDA, whose
+    embeddings are cached apart from fp32 ones.
+    Returns the embeddings stacked in input order.
+    """
+    import torch
+    use_fp16 = torch.cuda.is_available()
+    model_tag = f"{model_name}@fp16" if use_fp16 else model_name
+    
+    cache = {}
+    try:
+        if os.path.exists(cache_file):
+            with open(cache_file, 'rb') as f:
+                cache = pickle.load(f)
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable embedding cache: {e}")
+    
+    keys = [f"{model_tag}:{hashlib.sha1(text.encode()).hexdigest()}" for text in texts]
+    missing = {key: text for key, text in zip(keys, texts) if key not in cache}
+    if missing:
+        precision = torch.autocast('cuda', dtype=torch.float16) if use_fp16 else contextlib.nullcontext()
+        with torch.inference_mode(), precision:
+            # encode() already sorts texts by length so each batch pads to a similar size
+            embeddings = model.encode(list(missing.values()), batch_size=32,
+                                      show_progress_bar=False, convert_to_numpy=True)
+        embeddings = embeddings.astype(np.float32, copy=False)
+        cache.update(zip(missing, embeddings))
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, 'wb') as f:
+                pickle.dump(cache, f)
+        except Exception as e:
+            print(f"⚠️ Could not save embedding cache: {e}")
+    
+    return np.stack([cache[key] for key in keys])
+
+def _most_common_words(words, n=5):
+    """
+    Return the n most frequent words, counted with numpy's sort-based unique
+    
+    Ties are broken by first occurrence, matching Counter.most_common.
+    """
+    unique_words, first_seen, counts = np.unique(words.to_numpy(), return_index=True, return_counts=True)
+    order = np.lexsort((first_seen, -counts))[:n]
+    return unique_words[order].tolist()
 
 class Phase1Analyzer:
     """Comprehensive analysis for semantic relevance system planning"""
@@ -46,8 +134,7 @@ class Phase1Analyzer:
                 
                 # Test if we can load the model
                 try:
-                    from sentence_transformers import SentenceTransformer
-                    test_model = SentenceTransformer('all-MiniLM-L6-v2')
+                    test_model = _get_sentence_model('all-MiniLM-L6-v2')
                     print("✅ all-MiniLM-L6-v2 can be loaded successfully")
                     
                     # Test basic functionality
@@ -56,14 +143,15 @@ class Phase1Analyzer:
                         "Instructor position in mathematics department", 
                         "Software developer at tech company"
                     ]
-                    embeddings = test_model.encode(test_texts)
+                    embeddings = _embed_cached(test_model, test_texts, 'all-MiniLM-L6-v2')
                     print(f"✅ Model produces embeddings: {embeddings.shape}")
                     
-                    # Test similarity for education relevance
-                    from sklearn.metrics.pairwise import cosine_similarity
-                    sim_matrix = cosine_similarity(embeddings)
-                    education_sim = sim_matrix[0][1]  # Teaching vs Instructor
-                    non_education_sim = sim_matrix[0][2]  # Teaching vs Software dev
+                    # Test similarity for education relevance: all-pairs cosine
+                    # similarity is one matrix product of the L2-normalized rows
+                    unit = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+                    similarities = np.einsum('ik,jk->ij', unit, unit)
+                    education_sim = float(similarities[0, 1])  # Teaching vs Instructor
+                    non_education_sim = float(similarities[0, 2])  # Teaching vs Software dev
                     
                     print(f"📊 Teaching-Instructor similarity: {education_sim:.3f}")
                     print(f"📊 Teaching-Software Dev similarity: {non_education_sim:.3f}")
@@ -94,79 +182,95 @@ class Phase1Analyzer:
         
         try:
             # Load dataset
-            df = pd.read_csv('synthetic_teaching_dataset_highquality.csv')
+            # Read only the analysed columns, with titles and types as category codes
+            df = pd.read_csv(
+                'synthetic_teaching_dataset_highquality.csv',
+                usecols=['job_title', 'text', 'type', 'relevance'],
+                dtype={'job_title': 'category', 'type': 'category'}
+            )
+            # Order job categories by first appearance so value_counts ties keep file order
+            job_codes = df['job_title'].cat.codes.to_numpy()
+            df['job_title'] = df['job_title'].cat.reorder_categories(
+                df['job_title'].cat.categories[pd.unique(job_codes[job_codes >= 0])]
+            )
             print(f"✅ Dataset loaded: {len(df)} total entries")
             
+            # One counting pass over job_title; categories are already in first-appearance order
+            job_counts = df['job_title'].value_counts()
+            unique_jobs = df['job_title'].cat.categories
+            
             # Basic statistics
             print(f"📊 Columns: {list(df.columns)}")
-            print(f"📊 Job titles: {df['job_title'].nunique()} unique positions")
+            print(f"📊 Job titles: {len(job_counts)} unique positions")
             print(f"📊 Entry types: {df['type'].value_counts().to_dict()}")
             
             # Job title distribution
-            job_counts = df['job_title'].value_counts()
             print(f"\n📈 Job Title Distribution:")
             for job, count in job_counts.items():
                 print(f"   {job}: {count} entries")
             
+            # Relevance statistics and filters work on one numpy view of the column;
+            # the nan-aware reductions skip missing scores like pandas does
+            relevance = df['relevance'].to_numpy()
+            relevance_stats = {
+                'min': np.nanmin(relevance),
+                'max': np.nanmax(relevance),
+                'mean': np.nanmean(relevance),
+                'std': np.nanstd(relevance, ddof=1)
+            }
+            
             # Relevance score analysis
             print(f"\n📊 Relevance Score Statistics:")
-            print(f"   Range: {df['relevance'].min():.2f} - {df['relevance'].max():.2f}")
-            print(f"   Mean: {df['relevance'].mean():.3f}")
-            print(f"   Std: {df['relevance'].std():.3f}")
+            print(f"   Range: {relevance_stats['min']:.2f} - {relevance_stats['max']:.2f}")
+            print(f"   Mean: {relevance_stats['mean']:.3f}")
+            print(f"   Std: {relevance_stats['std']:.3f}")
             
             # Type vs relevance analysis
             print(f"\n📊 Type vs Relevance Analysis:")
-            type_relevance = df.groupby('type')['relevance'].agg(['mean', 'std', 'count'])
+            type_relevance = df.groupby('type', observed=True)['relevance'].agg(['mean', 'std', 'count'])
             print(type_relevance)
             
             # High relevance entries analysis
-            high_relevance = df[df['relevance'] >= 0.4]
+            high_relevance = df.iloc[relevance >= 0.4]
             print(f"\n🎯 High Relevance Entries (≥0.4): {len(high_relevance)} entries")
             print("   Top patterns:")
-            for i, (_, row) in enumerate(high_relevance.head(5).iterrows()):
-                print(f"   {i+1}. {row['text'][:60]}... (Score: {row['relevance']:.2f})")
+            for i, row in enumerate(high_relevance.head(5).itertuples(index=False), start=1):
+                print(f"   {i}. {row.text[:60]}... (Score: {row.relevance:.2f})")
             
             # Low relevance entries analysis
-            zero_relevance = df[df['relevance'] == 0.0]
+            zero_relevance = df.iloc[relevance == 0.0]
             print(f"\n❌ Zero Relevance Entries: {len(zero_relevance)} entries")
             if len(zero_relevance) > 0:
                 print("   Common patterns:")
-                for i, (_, row) in enumerate(zero_relevance.head(3).iterrows()):
-                    print(f"   {i+1}. {row['text'][:60]}...")
+                for i, row in enumerate(zero_relevance.head(3).itertuples(index=False), start=1):
+                    print(f"   {i}. {row.text[:60]}...")
             
             # Text length analysis
-            df['text_length'] = df['text'].str.len()
+            # Only aggregates are needed, so keep the lengths as an array rather than a column
+            text_lengths = df['text'].str.len().to_numpy()
             print(f"\n📝 Text Length Analysis:")
-            print(f"   Average length: {df['text_length'].mean():.1f} characters")
-            print(f"   Range: {df['text_length'].min()} - {df['text_length'].max()} characters")
+            print(f"   Average length: {text_lengths.mean():.1f} characters")
+            print(f"   Range: {text_lengths.min()} - {text_lengths.max()} characters")
             
             # Keywords analysis for different job levels
             print(f"\n🔍 Keyword Analysis by Job Level:")
-            for job_title in df['job_title'].unique():
-                job_data = df[df['job_title'] == job_title]
-                high_rel_texts = job_data[job_data['relevance'] >= 0.4]['text'].str.lower()
-                
-                # Extract common words
-                words = []
-                for text in high_rel_texts:
-                    words.extend(text.split())
-                
-                common_words = Counter(words).most_common(5)
-                print(f"   {job_title}: {[word for word, count in common_words]}")
+            # Tokenize every high relevance text once, one word per row, then
+            # count per job instead of re-filtering the frame for each job
+            words = high_relevance[['job_title']].assign(
+                word=high_relevance['text'].str.lower().str.split()
+            ).explode('word').dropna(subset=['word'])
+            top_words = words.groupby('job_title', sort=False, observed=True)['word'].agg(_most_common_words)
+            for job_title in unique_jobs:
+                print(f"   {job_title}: {top_words.get(job_title, [])}")
             
             self.results['dataset'] = {
                 'total_entries': len(df),
                 'job_titles': list(job_counts.index),
                 'job_distribution': job_counts.to_dict(),
-                'relevance_stats': {
-                    'min': df['relevance'].min(),
-                    'max': df['relevance'].max(),
-                    'mean': df['relevance'].mean(),
-                    'std': df['relevance'].std()
-                },
+                'relevance_stats': relevance_stats,
                 'high_relevance_count': len(high_relevance),
                 'zero_relevance_count': len(zero_relevance),
-                'avg_text_length': df['text_length'].mean()
+                'avg_text_length': text_lengths.mean()
             }
             
         except Exception as e:
@@ -185,14 +289,23 @@ class Phase1Analyzer:
         
         extraction_results = []
         
+        # One directory listing instead of a stat() per test file
+        present = {entry.name for entry in os.scandir('.') if entry.is_file()}
+        existing_files = [filename for filename in test_files if filename in present]
+        # Extract the files in parallel worker processes; results are reported in file order
+        extractions = {}
+        if existing_files:
+            with ProcessPoolExecutor(max_workers=min(len(existing_files), os.cpu_count() or 1)) as executor:
+                extractions = {filename: executor.submit(_extract_pds_file, filename)
+                               for filename in existing_files}
+        
         for filename in test_files:
-            if os.path.exists(filename):
+            if filename in extractions:
                 print(f"\n🔍 Testing: {filename}")
                 
                 try:
                     # Test ImprovedPDSExtractor
-                    extractor = ImprovedPDSExtractor()
-                    result = extractor.extract_pds_data(filename)
+                    result = extractions[filename].result()
                     
                     if result:
                         print(f"✅ Extraction successful")
@@ -217,21 +330,15 @@ class Phase1Analyzer:
                         # Check for contamination issues
                         contamination_issues = []
                         
-                        # Check if work experience has eligibility data
-                        for exp in work_exp:
-                            if isinstance(exp, dict):
-                                exp_text = str(exp).lower()
-                                if any(keyword in exp_text for keyword in ['eligibility', 'civil service', 'prc license']):
-                                    contamination_issues.append("Work experience contains eligibility data")
-                                    break
+                        # Check if work experience has eligibility data (stops at the first hit)
+                        if any(isinstance(exp, dict) and _ELIGIBILITY_IN_WORK_RE.search(_values_lower(exp))
+                               for exp in work_exp):
+                            contamination_issues.append("Work experience contains eligibility data")
                         
                         # Check if eligibility has work experience data
-                        for elig in eligibility:
-                            if isinstance(elig, dict):
-                                elig_text = str(elig).lower()
-                                if any(keyword in elig_text for keyword in ['company', 'position', 'salary', 'supervisor']):
-                                    contamination_issues.append("Eligibility contains work experience data")
-                                    break
+                        if any(isinstance(elig, dict) and _WORK_IN_ELIGIBILITY_RE.search(_values_lower(elig))
+                               for elig in eligibility):
+                            contamination_issues.append("Eligibility contains work experience data")
                         
                         if contamination_issues:
                             print(f"⚠️ Contamination Issues Found:")
@@ -344,8 +451,8 @@ class Phase1Analyzer:
         print("-" * 40)
         
         # Save detailed JSON report
-        with open('phase1_analysis_report.json', 'w') as f:
-            json.dump(self.results, f, indent=2, default=str)
+        # Normalize once up front so the encoder rarely needs its default callback
+        write_json_report('phase1_analysis_report.json', _to_native(self.results), default=str)
         
         print("✅ Detailed report saved: phase1_analysis_report.json")
         
@@ -359,8 +466,7 @@ class Phase1Analyzer:
             'ready_for_phase2': True
         }
         
-        with open('phase1_summary.json', 'w') as f:
-            json.dump(summary, f, indent=2)
+        write_json_report('phase1_summary.json', summary)
         
         print("✅ Summary report saved: phase1_summary.json")
         print(f"📊 Analysis complete - {len(self.results.get('recommendations', []))} recommendations generated")
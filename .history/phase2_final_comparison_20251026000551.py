@@ -4,10 +4,14 @@ Phase 2 Final Comparison and Analysis
 Compare original vs enhanced extraction results
 """
 
-import json
+import re
 from datetime import datetime
 from improved_pds_extractor import ImprovedPDSExtractor
 from enhanced_pds_extractor import EnhancedPDSExtractor
+from report_writer import write_json_report
+
+# Keywords of a clean eligibility entry, matched in one scan of its lower-cased text
+_ELIGIBILITY_RE = re.compile(r'civil service|eligibility|exam|rating|board|licensure|professional')
 
 def compare_extractors():
     """Compare original vs enhanced extractor performance"""
@@ -96,8 +100,7 @@ def compare_extractors():
         'next_steps': generate_next_steps(improvements, improvement_percentage)
     }
     
-    with open('phase2_final_comparison.json', 'w') as f:
-        json.dump(comparison_report, f, indent=2)
+    write_json_report('phase2_final_comparison.json', comparison_report)
     
     print(f"\n📁 Detailed report saved: phase2_final_comparison.json")
     
@@ -121,12 +124,11 @@ def analyze_extraction_result(result, extractor_name):
     # Eligibility analysis
     eligibility = result.get('civil_service_eligibility', [])
     clean_entries = 0
-    eligibility_keywords = ['civil service', 'eligibility', 'exam', 'rating', 'board', 'licensure', 'professional']
     
     for entry in eligibility:
         if isinstance(entry, dict):
             eligibility_text = entry.get('eligibility', '').lower()
-            if any(keyword in eligibility_text for keyword in eligibility_keywords):
+            if _ELIGIBILITY_RE.search(eligibility_text):
                 clean_entries += 1
     
     contamination_rate = (len(eligibility) - clean_entries) / max(len(eligibility), 1)
@@ -3559,14 +3559,15 @@ class PDSAssessmentApp:
                                 'civil_service_eligibility': candidate.get('eligibility', [])
                             }
                         
-                        # Perform enhanced assessment
+                        # Perform enhanced assessment; only the recommended score is used,
+                        # traditional scoring runs only if semantic scoring is unavailable
                         enhanced_result = self.enhanced_assessment_engine.assess_candidate_enhanced(
                             pds_data, job_posting, 
                             include_semantic=True, 
-                            include_traditional=True
+                            include_traditional=False
                         )
                         
-                        # Return the recommended score (which combines semantic + traditional)
+                        # Return the recommended score (semantic, or traditional as fallback)
                         recommended_score = enhanced_result.get('recommended_score', 0)
                         return round(recommended_score, 1)
                         
@@ -5959,13 +5960,14 @@ class PDSAssessmentApp:
     def get_job_posting_criteria(self, job_id):
         """Get assessment criteria for a job posting"""
         try:
-            cursor = db_manager.get_connection().cursor()
-            cursor.execute("""
-                SELECT * FROM job_assessment_criteria 
-                WHERE job_posting_id = ? 
-                ORDER BY criteria_name
-            """, (job_id,))
-            rows = cursor.fetchall()
+            with db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT * FROM job_assessment_criteria 
+                    WHERE job_posting_id = ? 
+                    ORDER BY criteria_name
+                """, (job_id,))
+                rows = cursor.fetchall()
             
             criteria = []
             for row in rows:
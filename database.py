@@ -1,7 +1,10 @@
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool, PoolError
 import json
 import logging
+import threading
+import weakref
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import os
@@ -14,6 +17,70 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Connection pool bounds, shared by every DatabaseManager using the same URL
+POOL_MIN_CONNECTIONS = int(os.getenv('DB_POOL_MIN', '1'))
+POOL_MAX_CONNECTIONS = int(os.getenv('DB_POOL_MAX', '8'))
+
+_POOLS: Dict[str, ThreadedConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+# Names of the server-side prepared statements already created on each connection
+_PREPARED_STATEMENTS = weakref.WeakKeyDictionary()
+
+def _get_pool(db_url: str) -> ThreadedConnectionPool:
+    """Get the process-wide connection pool for a database URL, creating it on first use"""
+    pool = _POOLS.get(db_url)
+    if pool is None:
+        with _POOLS_LOCK:
+            pool = _POOLS.get(db_url)
+            if pool is None:
+                pool = ThreadedConnectionPool(
+                    POOL_MIN_CONNECTIONS, POOL_MAX_CONNECTIONS,
+                    db_url, cursor_factory=RealDictCursor
+                )
+                _POOLS[db_url] = pool
+    return pool
+
+class PooledConnection:
+    """
+    psycopg2 connection borrowed from a pool
+    
+    Used as ``with db_manager.get_connection() as conn:`` it commits or rolls
+    back like a plain psycopg2 connection and then goes back to the pool.
+    A wrapper dropped without close() returns its connection when it is
+    garbage-collected. Any other attribute is forwarded to the underlying
+    connection.
+    """
+    
+    def __init__(self, conn, pool: Optional[ThreadedConnectionPool] = None):
+        self._conn = conn
+        self._pool = pool
+    
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+    
+    def __enter__(self):
+        return self._conn.__enter__()
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            return self._conn.__exit__(exc_type, exc_value, traceback)
+        finally:
+            self.close()
+    
+    def __del__(self):
+        self.close()
+    
+    def close(self):
+        """Return the connection to its pool, or close it if it was opened outside one"""
+        if self._conn is None:
+            return
+        conn, self._conn = self._conn, None
+        if self._pool is not None:
+            self._pool.putconn(conn)
+        else:
+            conn.close()
+
 class DatabaseManager:
     def __init__(self, db_url: str = None):
         self.db_url = db_url or os.getenv('DATABASE_URL')
@@ -58,21 +125,45 @@ class DatabaseManager:
             self.sqlite_assessment = None
     
     def get_connection(self):
-        """Get database connection"""
+        """Get database connection from the shared pool"""
         if self.use_sqlite:
             # This should not be used for SQLite, but provide a graceful error
             raise RuntimeError("SQLite mode active - use sqlite_assessment methods")
         
         try:
-            conn = psycopg2.connect(
-                self.db_url,
-                cursor_factory=RealDictCursor
-            )
-            return conn
+            pool = _get_pool(self.db_url)
+            try:
+                return PooledConnection(pool.getconn(), pool)
+            except PoolError:
+                # Every pooled connection is in use, fall back to a dedicated connection
+                logger.warning("Connection pool exhausted, opening a dedicated connection")
+                return PooledConnection(psycopg2.connect(self.db_url, cursor_factory=RealDictCursor))
         except psycopg2.Error as e:
             logger.error(f"Database connection error: {e}")
             raise
     
+    def execute_prepared(self, cursor, name: str, query: str, params: tuple = ()):
+        """
+        Execute a query as a server-side prepared statement
+        
+        The statement is prepared once per pooled connection, so repeated
+        lookups on that connection skip parsing and planning.
+        
+        Args:
+            cursor: Cursor of a connection from get_connection()
+            name: Prepared statement name
+            query: SQL with $1, $2, ... placeholders
+            params: Parameter values
+        """
+        conn = cursor.connection
+        prepared = _PREPARED_STATEMENTS.setdefault(conn, set())
+        if name not in prepared:
+            cursor.execute(f"PREPARE {name} AS {query}")
+            prepared.add(name)
+        
+        placeholders = ', '.join(['%s'] * len(params))
+        cursor.execute(f"EXECUTE {name}({placeholders})" if params else f"EXECUTE {name}", params)
+    
     def init_database(self):
         """Initialize database with all required tables"""
         if self.use_sqlite:
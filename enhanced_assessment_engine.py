@@ -5,26 +5,140 @@ Integrates semantic scoring with traditional assessment methods
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import os
+import time
+from typing import Dict, List, Any, Optional, Tuple, Iterator
+from dataclasses import dataclass, field, fields, replace
 from datetime import datetime
 import json
+import hashlib
+import threading
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Import existing assessment engine
 from assessment_engine import UniversityAssessmentEngine
 
-# Import semantic engine
-from semantic_engine import get_semantic_engine
+# The semantic engine (sentence-transformers/torch) is imported on first use,
+# see EnhancedUniversityAssessmentEngine.semantic_engine
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of distinct job postings kept in the job-side caches
+JOB_CACHE_SIZE = 256
+
+# Maximum number of (candidate, job) assessment results kept for reuse
+RESULT_CACHE_SIZE = 4096
+
+# Logged once the first time a caller relies on the include_traditional default
+_traditional_default_warned = False
+
+# Batch progress is logged once per this many assessed candidates
+PROGRESS_EVERY = 1000
+
+# Semantic weight keys, in the column order of the batch component matrix
+SEMANTIC_WEIGHT_KEYS = ('education_relevance', 'experience_relevance',
+                        'training_relevance', 'overall_quality_bonus')
+_REQUIRED_WEIGHTS = frozenset(SEMANTIC_WEIGHT_KEYS)
+
+def _semantic_score_kernel(components: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Weighted semantic scores for a whole batch of candidates
+    
+    Args:
+        components: (N, 4) education, experience, training and overall relevance
+        weights: (4,) weights in SEMANTIC_WEIGHT_KEYS order
+        
+    Returns:
+        (N,) final semantic scores clamped to 0-100
+    """
+    # Summed term by term, in the same order as the per-candidate calculation,
+    # so batch scores match it exactly after rounding
+    weighted = (components[:, 0] * weights[0] + components[:, 1] * weights[1] +
+                components[:, 2] * weights[2] + components[:, 3] * weights[3])
+    return np.clip(weighted * 100, 0, 100)
+
+def _content_hash(data: Any) -> str:
+    """Stable hash of JSON-like data, used to key caches on content rather than identity"""
+    if ORJSON_AVAILABLE:
+        try:
+            content = orjson.dumps(data, default=str,
+                                   option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+            return hashlib.blake2b(content, digest_size=16).hexdigest()
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits, which only the stdlib encoder handles
+    content = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+def _l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+    """Scale rows (or a single vector) to unit length, leaving already-normalized input untouched"""
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    if np.allclose(norms, 1.0):
+        return embeddings
+    return embeddings / np.where(norms == 0, 1.0, norms)
+
+@dataclass(slots=True)
+class AssessmentResult:
+    """
+    Result of a single enhanced candidate assessment
+    
+    Supports result['key'] and result.get('key') like the dictionaries it
+    replaces; use to_dict() where a plain dict is needed (e.g. JSON responses).
+    """
+    candidate_id: Any
+    job_id: Any
+    assessment_timestamp: Optional[str] = None
+    semantic_score: Optional[float] = None
+    traditional_score: Optional[float] = None
+    recommended_score: Optional[float] = None  # The score to use for ranking
+    assessment_method: str = 'hybrid'
+    semantic_breakdown: Dict = field(default_factory=dict)
+    traditional_breakdown: Dict = field(default_factory=dict)
+    performance_metrics: Dict = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict:
+        """Materialize the result as a plain dictionary"""
+        return {name: getattr(self, name) for name in _RESULT_FIELDS}
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default) if key in _RESULT_FIELDS else default
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in _RESULT_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value: Any):
+        if key not in _RESULT_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in _RESULT_FIELDS
+
+_RESULT_FIELDS = tuple(f.name for f in fields(AssessmentResult))
+
 class EnhancedUniversityAssessmentEngine(UniversityAssessmentEngine):
     """
     Enhanced assessment engine that combines traditional and semantic scoring
     Provides dual scoring system with semantic relevance as default
     """
     
-    def __init__(self, db_manager=None):
-        """Initialize enhanced assessment engine"""
+    def __init__(self, db_manager=None, semantic_precision: str = None):
+        """
+        Initialize enhanced assessment engine
+        
+        Args:
+            db_manager: Database manager, created from the environment if not given
+            semantic_precision: Encoder precision 'fp32', 'fp16' or 'bf16'
+                (defaults to the SEMANTIC_PRECISION environment variable, then fp32)
+        """
         # Initialize database manager if not provided
         if db_manager is None:
             from database import DatabaseManager
@@ -32,14 +146,10 @@ class EnhancedUniversityAssessmentEngine(UniversityAssessmentEngine):
         
         super().__init__(db_manager)
         
-        # Initialize semantic engine with error handling
-        try:
-            self.semantic_engine = get_semantic_engine()
-            self.semantic_available = True
-        except Exception as e:
-            logger.warning(f"⚠️ Semantic engine initialization failed in enhanced assessment: {e}")
-            self.semantic_engine = None
-            self.semantic_available = False
+        # Semantic engine is loaded lazily on first access
+        self._semantic_engine = None
+        self._semantic_available = None
+        self.semantic_precision = semantic_precision or os.getenv('SEMANTIC_PRECISION', 'fp32')
         
         # Semantic scoring weights (updated for PDS structure and university criteria)
         self.semantic_weights = {
@@ -48,6 +158,8 @@ class EnhancedUniversityAssessmentEngine(UniversityAssessmentEngine):
             'training_relevance': 0.15,     # Replaces skills - uses learning_development
             'overall_quality_bonus': 0.05   # Small bonus for overall job fit
         }
+        # Shared, read-only copy reported as weights_used; replaced on every weight update
+        self._weights_snapshot = dict(self.semantic_weights)
         
         # University criteria weights (from official scoring sheet)
         self.university_weights = {
@@ -64,13 +176,83 @@ class EnhancedUniversityAssessmentEngine(UniversityAssessmentEngine):
             'total_assessments': 0,
             'semantic_assessments': 0,
             'traditional_assessments': 0,
-            'fallback_to_traditional': 0
+            'fallback_to_traditional': 0,
+            'job_cache_hits': 0,
+            'job_cache_misses': 0,
+            'result_cache_hits': 0,
+            'result_cache_misses': 0
         }
+        
+        # Job-side work cached per (job_id, content hash) so edited postings invalidate
+        self._job_embeddings_cache = {}
+        self._job_requirements_cache = {}
+        
+        # Full assessment results per (candidate, job, options), least recently used first
+        self._result_cache = {}
+        # Guards the caches and counters when one engine serves several request threads
+        self._cache_lock = threading.RLock()
+        
+        # Semantic engine readiness and model name are resolved once, not per assessment
+        self.invalidate_semantic_cache()
+    
+    @property
+    def semantic_engine(self):
+        """Semantic engine, imported and initialized on first access"""
+        if self._semantic_available is None:
+            try:
+                from semantic_engine import get_semantic_engine
+                self._semantic_engine = get_semantic_engine()
+                self._semantic_available = True
+                if self.semantic_precision != 'fp32':
+                    self._semantic_engine.set_precision(self.semantic_precision)
+            except Exception as e:
+                logger.warning(f"⚠️ Semantic engine initialization failed in enhanced assessment: {e}")
+                self._semantic_engine = None
+                self._semantic_available = False
+        return self._semantic_engine
+    
+    @semantic_engine.setter
+    def semantic_engine(self, engine):
+        self._semantic_engine = engine
+        self._semantic_available = engine is not None
+        self.invalidate_semantic_cache()
+    
+    @property
+    def semantic_available(self) -> bool:
+        """Whether the semantic engine could be initialized"""
+        self.semantic_engine
+        return self._semantic_available
+    
+    def invalidate_semantic_cache(self):
+        """Re-read semantic engine state; call after swapping or reloading the engine"""
+        self._semantic_state = None
+        # Job embeddings and results from a different model are no longer comparable
+        with self._cache_lock:
+            self._job_embeddings_cache.clear()
+            self._result_cache.clear()
+    
+    def _resolve_semantic_state(self) -> Tuple[bool, str]:
+        """Semantic engine readiness and model name, resolved once per engine"""
+        if self._semantic_state is None:
+            engine = self.semantic_engine
+            self._semantic_state = (
+                bool(self._semantic_available and engine and engine.is_available()),
+                getattr(engine, 'model_name', 'N/A')
+            )
+        return self._semantic_state
+    
+    @property
+    def _semantic_ready(self) -> bool:
+        return self._resolve_semantic_state()[0]
     
     def assess_candidate_enhanced(self, candidate_data: Dict, job_data: Dict, 
                                  include_semantic: bool = True, 
-                                 include_traditional: bool = True,
-                                 manual_scores: Dict = None) -> Dict:
+                                 include_traditional: Optional[bool] = None,
+                                 manual_scores: Dict = None,
+                                 semantic_details: Dict = None,
+                                 assessment_timestamp: str = None,
+                                 include_breakdown: bool = True,
+                                 use_result_cache: bool = True) -> 'AssessmentResult':
         """
         Enhanced candidate assessment with dual scoring system
         
@@ -78,53 +260,91 @@ class EnhancedUniversityAssessmentEngine(UniversityAssessmentEngine):
             candidate_data: Candidate information
             job_data: Job requirements
             include_semantic: Whether to calculate semantic scores
-            include_traditional: Whether to calculate traditional scores
+            include_traditional: Whether to also calculate traditional scores for
+                comparison (default False); traditional scoring still runs as a
+                fallback when semantic scoring is unavailable or fails
             manual_scores: Manual scores for potential and performance (if available)
+            semantic_details: Pre-computed semantic details (from batch encoding)
+            assessment_timestamp: ISO timestamp to record (batch callers share one per batch)
+            include_breakdown: Whether to build the detailed semantic breakdown
+            use_result_cache: Whether to reuse and store results for identical
+                (candidate, job, options) inputs. Results served from the cache are
+                marked performance_metrics['cached'] and share their breakdown
+                dicts with the cached entry, so treat them as read-only.
             
         Returns:
-            Dictionary with both semantic and traditional assessment results
+            AssessmentResult with both semantic and traditional assessment results
         """
-        assessment_start = datetime.now()
+        assessment_start = time.perf_counter()
+        if include_traditional is None:
+            global _traditional_default_warned
+            if not _traditional_default_warned:
+                _traditional_default_warned = True
+                logger.warning("assess_candidate_enhanced no longer computes traditional scores by "
+                               "default; pass include_traditional=True if traditional_score is needed")
+            include_traditional = False
+        if assessment_timestamp is None:
+            assessment_timestamp = datetime.now().isoformat()
+        
+        # Reuse the result if this exact candidate and job were already assessed
+        if use_result_cache:
+            result_key = self._result_cache_key(candidate_data, job_data, include_semantic,
+                                                include_traditional, manual_scores, include_breakdown)
+            with self._cache_lock:
+                cached_result = self._result_cache.pop(result_key, None)
+                if cached_result is not None:
+                    self._result_cache[result_key] = cached_result  # Mark as most recently used
+                    self.assessment_stats['result_cache_hits'] += 1
+                else:
+                    self.assessment_stats['result_cache_misses'] += 1
+            if cached_result is not None:
+                # Fresh top-level fields; the breakdown dicts stay shared with the cache
+                return replace(
+                    cached_result,
+                    assessment_timestamp=assessment_timestamp,
+                    errors=[],
+                    performance_metrics={
+                        **cached_result.performance_metrics,
+                        'assessment_time_seconds': round(time.perf_counter() - assessment_start, 3),
+                        'cached': True
+                    })
+        
+        # Resolved once per engine; read into locals instead of per-use lookups
+        semantic_ready, model_name = self._resolve_semantic_state()
         
         # Initialize result structure
-        result = {
-            'candidate_id': candidate_data.get('id'),
-            'job_id': job_data.get('id'),
-            'assessment_timestamp': assessment_start.isoformat(),
-            'semantic_score': None,
-            'traditional_score': None,
-            'recommended_score': None,  # The score to use for ranking
-            'assessment_method': 'hybrid',
-            'semantic_breakdown': {},
-            'traditional_breakdown': {},
-            'performance_metrics': {},
-            'errors': []
-        }
+        result = AssessmentResult(
+            candidate_id=candidate_data.get('id'),
+            job_id=job_data.get('id'),
+            assessment_timestamp=assessment_timestamp
+        )
         
         # Calculate semantic scores (default method)
-        if include_semantic and self.semantic_available and self.semantic_engine and self.semantic_engine.is_available():
+        if include_semantic and semantic_ready:
             try:
-                semantic_result = self._calculate_semantic_assessment(candidate_data, job_data)
-                result['semantic_score'] = semantic_result['final_score']
-                result['semantic_breakdown'] = semantic_result['breakdown']
-                result['recommended_score'] = semantic_result['final_score']
-                result['assessment_method'] = 'semantic'
+                semantic_result = self._calculate_semantic_assessment(
+                    candidate_data, job_data, semantic_details=semantic_details,
+                    include_breakdown=include_breakdown)
+                result.semantic_score = semantic_result['final_score']
+                result.semantic_breakdown = semantic_result.get('breakdown', {})
+                result.recommended_score = semantic_result['final_score']
+                result.assessment_method = 'semantic'
                 
-                self.assessment_stats['semantic_assessments'] += 1
+                with self._cache_lock:
+                    self.assessment_stats['semantic_assessments'] += 1
                 
             except Exception as e:
                 error_msg = f"Semantic assessment failed: {str(e)}"
-                result['errors'].append(error_msg)
+                result.errors.append(error_msg)
                 logger.error(error_msg)
                 
                 # Fallback to traditional if semantic fails
-                if include_traditional:
-                    include_traditional = True
-                    result['assessment_method'] = 'traditional_fallback'
+                result.assessment_method = 'traditional_fallback'
+                with self._cache_lock:
                     self.assessment_stats['fallback_to_traditional'] += 1
         
         # Calculate traditional scores (for comparison or fallback)
-        if include_traditional:
+        if include_traditional or result.recommended_score is None:
             try:
                 # Map PDS fields to assessment engine expected format
                 mapped_candidate_data = self._map_pds_fields_for_traditional_assessment(candidate_data)
@@ -146,11 +366,11 @@ class EnhancedUniversityAssessmentEngine(UniversityAssessmentEngine):
                 manual_performance = manual_scores.get('performance', 0) if manual_scores else 0
                 traditional_score = automated_score + manual_potential + manual_performance
                 
-                result['traditional_score'] = traditional_score
+                result.traditional_score = traditional_score
                 
                 # Extract detailed scores from nested structure
                 assessment_results = traditional_result.get('assessment_results', {})
-                result['traditional_breakdown'] = {
+                result.traditional_breakdown = {
                     'education': assessment_results.get('education', {}).get('score', 0),
                     'experience': assessment_results.get('experience', {}).get('score', 0), 
                     'training': assessment_results.get('training', {}).get('score', 0),
@@ -160,64 +380,97 @@ class EnhancedUniversityAssessmentEngine(UniversityAssessmentEngine):
                 }
                 
                 # Use traditional as recommended if semantic not available
-                if result['recommended_score'] is None:
-                    result['recommended_score'] = traditional_result.get('final_score', 0)
-                    result['assessment_method'] = 'traditional'
+                if result.recommended_score is None:
+                    result.recommended_score = traditional_result.get('final_score', 0)
+                    result.assessment_method = 'traditional'
                 
-                self.assessment_stats['traditional_assessments'] += 1
+                with self._cache_lock:
+                    self.assessment_stats['traditional_assessments'] += 1
                 
             except Exception as e:
                 error_msg = f"Traditional assessment failed: {str(e)}"
-                result['errors'].append(error_msg)
+                result.errors.append(error_msg)
                 logger.error(error_msg)
         
         # Calculate performance metrics
-        assessment_end = datetime.now()
-        assessment_time = (assessment_end - assessment_start).total_seconds()
+        assessment_time = time.perf_counter() - assessment_start
         
-        result['performance_metrics'] = {
+        result.performance_metrics = {
             'assessment_time_seconds': round(assessment_time, 3),
-            'semantic_available': self.semantic_available and self.semantic_engine and self.semantic_engine.is_available(),
-            'model_used': getattr(self.semantic_engine, 'model_name', 'N/A')
+            'semantic_available': semantic_ready,
+            'model_used': model_name
         }
         
         # Ensure we have a recommended score
-        if result['recommended_score'] is None:
-            result['recommended_score'] = 0
-            result['assessment_method'] = 'failed'
-            result['errors'].append("No assessment method succeeded")
-        
-        self.assessment_stats['total_assessments'] += 1
+        if result.recommended_score is None:
+            result.recommended_score = 0
+            result.assessment_method = 'failed'
+            result.errors.append("No assessment method succeeded")
+        
+        with self._cache_lock:
+            self.assessment_stats['total_assessments'] += 1
+        
+        # Only keep clean results so transient failures are retried. The cache
+        # holds its own top-level copy; nested dicts are shared and read-only.
+        if use_result_cache and not result.errors:
+            cached_result = replace(result, errors=[],
+                                    performance_metrics=dict(result.performance_metrics))
+            with self._cache_lock:
+                if len(self._result_cache) >= RESULT_CACHE_SIZE:
+                    self._result_cache.pop(next(iter(self._result_cache)))
+                self._result_cache[result_key] = cached_result
         
         return result
     
-    def _calculate_semantic_assessment(self, candidate_data: Dict, job_data: Dict) -> Dict:
+    def _result_cache_key(self, candidate_data: Dict, job_data: Dict, include_semantic: bool,
+                          include_traditional: bool, manual_scores: Optional[Dict],
+                          include_breakdown: bool) -> Tuple:
+        """Build the result cache key from ids, content hashes and assessment options"""
+        return (
+            candidate_data.get('id'), job_data.get('id'),
+            _content_hash(candidate_data), _content_hash(job_data),
+            include_semantic, include_traditional,
+            _content_hash(manual_scores) if manual_scores else None,
+            include_breakdown
+        )
+    
+    def _calculate_semantic_assessment(self, candidate_data: Dict, job_data: Dict,
+                                       semantic_details: Dict = None,
+                                       include_breakdown: bool = True) -> Dict:
         """
         Calculate semantic assessment scores with detailed breakdown
         
         Args:
             candidate_data: Candidate information
             job_data: Job requirements
+            semantic_details: Pre-computed semantic details, skips re-encoding when given
+            include_breakdown: Whether to build the breakdown; when False only
+                'final_score' is returned
             
         Returns:
             Dictionary with semantic scores and breakdown
         """
-        # Get detailed semantic scores
-        if self.semantic_available and self.semantic_engine:
-            semantic_details = self.semantic_engine.calculate_detailed_semantic_score(
-                candidate_data, job_data)
-        else:
-            # Fallback when semantic engine is not available
-            semantic_details = {
-                'education_relevance': 0.0,
-                'experience_relevance': 0.0,
-                'training_relevance': 0.0,
-                'overall_score': 0.0
-            }
+        # Get detailed semantic scores unless the batch path pre-computed them
+        if semantic_details is None:
+            if self.semantic_available and self.semantic_engine:
+                semantic_details = self.semantic_engine.calculate_detailed_semantic_score(
+                    candidate_data, job_data)
+            else:
+                # Fallback when semantic engine is not available
+                semantic_details = {
+                    'education_relevance': 0.0,
+                    'experience_relevance': 0.0,
+                    'training_relevance': 0.0,
+                    'overall_score': 0.0
+                }
         
         if 'error' in semantic_details:
             raise Exception(semantic_details['error'])
         
+        # Batch scores are already weighted, nothing left to compute
+        if 'semantic_score' in semantic_details and not include_breakdown:
+            return {'final_score': round(semantic_details['semantic_score'], 1)}
+        
         # Extract component scores
         education_relevance = semantic_details.get('education_relevance', 0.0)
         experience_relevance = semantic_details.get('experience_relevance', 0.0)
@@ -234,9 +487,15 @@ class EnhancedUniversityAssessmentEngine(UniversityAssessmentEngine):
         # Apply overall quality bonus
         quality_bonus = overall_score * self.semantic_weights['overall_quality_bonus']
         
-        # Final semantic score (scale to 0-100)
-        final_semantic_score = (weighted_score + quality_bonus) * 100
-        final_semantic_score = max(0, min(100, final_semantic_score))  # Clamp to 0-100
+        # Final semantic score (scale to 0-100), already weighted when batch-computed
+        if 'semantic_score' in semantic_details:
+            final_semantic_score = semantic_details['semantic_score']
+        else:
+            final_semantic_score = (weighted_score + quality_bonus) * 100
+            final_semantic_score = max(0, min(100, final_semantic_score))  # Clamp to 0-100
+        
+        if not include_breakdown:
+            return {'final_score': round(final_semantic_score, 1)}
         
         # Create detailed breakdown
         breakdown = {
@@ -256,7 +515,7 @@ class EnhancedUniversityAssessmentEngine(UniversityAssessmentEngine):
                 'final_score_0_1': round((weighted_score + quality_bonus), 3),
                 'final_score_0_100': round(final_semantic_score, 1)
             },
-            'weights_used': self.semantic_weights.copy(),
+            'weights_used': self._weights_snapshot,
             'model_info': {
                 'model_name': semantic_details.get('model_used', 'unknown'),
                 'similarity_threshold': semantic_details.get('similarity_threshold', 0.3)
@@ -268,8 +527,144 @@ class EnhancedUniversityAssessmentEngine(UniversityAssessmentEngine):
             'breakdown': breakdown
         }
     
+    def _job_cache_key(self, job_data: Dict) -> Tuple:
+        """Build the job-side cache key from the job id and a hash of its content"""
+        return (job_data.get('id'), _content_hash(job_data))
+    
+    def _cached_job_value(self, cache: Dict, job_data: Dict, compute, should_store=None):
+        """
+        Return a cached job-side value, computing it on a miss
+        
+        A computed value is stored unless should_store(value) is false, so
+        failed computations are retried instead of cached.
+        """
+        key = self._job_cache_key(job_data)
+        with self._cache_lock:
+            if key in cache:
+                self.assessment_stats['job_cache_hits'] += 1
+                return cache[key]
+            
+            # Computed under the lock so concurrent requests don't all encode the same posting
+            self.assessment_stats['job_cache_misses'] += 1
+            value = compute(job_data)
+            if should_store is not None and not should_store(value):
+                return value
+            if len(cache) >= JOB_CACHE_SIZE:
+                cache.pop(next(iter(cache)))  # Evict the oldest posting
+            cache[key] = value
+            return value
+    
+    def _get_job_embeddings(self, job_data: Dict) -> Dict:
+        """Get the job-side embeddings for a posting, encoding it once per content version"""
+        # Failed encodings are not cached
+        return self._cached_job_value(
+            self._job_embeddings_cache, job_data, self.semantic_engine.encode_job_components,
+            should_store=lambda embeddings: embeddings['overall'] is not None)
+    
+    def parse_lspu_job_requirements(self, lspu_job: Dict) -> Dict[str, Any]:
+        """Parse LSPU job requirements once per posting and reuse them across candidates"""
+        requirements = self._cached_job_value(
+            self._job_requirements_cache, lspu_job, super().parse_lspu_job_requirements)
+        # Results embed this dict as job_requirements_used, so each caller gets
+        # its own copy (the values are strings, numbers and lists of strings)
+        return {key: list(value) if isinstance(value, list) else value
+                for key, value in requirements.items()}
+    
+    def _batch_encode_candidates(self, candidates_data: List[Dict], job_data: Dict) -> Optional[List[Dict]]:
+        """
+        Compute semantic details for a whole batch with one encode call per component
+        
+        Args:
+            candidates_data: List of candidate dictionaries
+            job_data: Job requirements
+            
+        Returns:
+            Per-candidate semantic details shaped like calculate_detailed_semantic_score,
+            or None when the model is not loaded and candidates must be scored one by one
+        """
+        engine = self.semantic_engine
+        if engine.model is None:
+            return None
+        
+        job_embeddings = self._get_job_embeddings(job_data)
+        if job_embeddings['overall'] is None:
+            return None
+        
+        # Candidate text builder and cache context for each scored component,
+        # in the column order of the similarity matrix
+        components = (
+            ('education', engine.build_education_text, 'education'),
+            ('experience', engine.build_experience_text, 'experience'),
+            ('training', engine.build_training_text, 'training'),
+            ('overall', engine.build_candidate_profile_text, None)
+        )
+        
+        count = len(candidates_data)
+        similarities = np.zeros((count, len(components)))
+        has_profile = None
+        
+        for column, (component, build_text, context) in enumerate(components):
+            texts = [build_text(candidate) for candidate in candidates_data]
+            if component == 'overall':
+                indices = [i for i, text in enumerate(texts) if text.strip()]
+                has_profile = set(indices)
+                context = [f"candidate_{candidates_data[i].get('id', 'unknown')}" for i in indices]
+            else:
+                indices = [i for i, text in enumerate(texts) if text]
+            
+            job_embedding = job_embeddings[component]
+            if indices and job_embedding is not None:
+                embeddings = engine.encode_texts([texts[i] for i in indices], context)
+                if embeddings is None:
+                    return None
+                # Cosine similarity as one matrix-vector product, mapped onto 0-1
+                embeddings = _l2_normalize(embeddings)
+                job_embedding = _l2_normalize(job_embedding)
+                cosine = np.einsum('ij,j->i', embeddings, job_embedding)
+                similarities[indices, column] = np.clip((cosine + 1) / 2, 0.0, 1.0)
+        
+        details = []
+        scored = []
+        for i in range(count):
+            if i not in has_profile:
+                details.append({
+                    'overall_score': 0.0,
+                    'education_relevance': 0.0,
+                    'experience_relevance': 0.0,
+                    'training_relevance': 0.0,
+                    'error': 'Failed to generate embeddings'
+                })
+                continue
+            
+            education, experience, training, overall = similarities[i].tolist()
+            details.append({
+                'overall_score': round(overall, 3),
+                'education_relevance': round(education, 3),
+                'experience_relevance': round(experience, 3),
+                'training_relevance': round(training, 3),
+                'similarity_threshold': engine.similarity_threshold,
+                'model_used': engine.model_name
+            })
+            scored.append(details[-1])
+        
+        # Weight every candidate's components in one vectorized pass
+        if scored:
+            components = np.array([[row['education_relevance'], row['experience_relevance'],
+                                    row['training_relevance'], row['overall_score']] for row in scored])
+            semantic_scores = _semantic_score_kernel(components, self._semantic_weight_vector())
+            for row, score in zip(scored, semantic_scores):
+                row['semantic_score'] = float(score)
+        
+        return details
+    
+    def _semantic_weight_vector(self) -> np.ndarray:
+        """Current semantic weights as a vector in SEMANTIC_WEIGHT_KEYS order"""
+        return np.array([self.semantic_weights[key] for key in SEMANTIC_WEIGHT_KEYS])
+    
     def batch_assess_candidates(self, candidates_data: List[Dict], job_data: Dict, 
-                              include_semantic: bool = True) -> List[Dict]:
+                              include_semantic: bool = True,
+                              include_breakdown: bool = False,
+                              include_traditional: bool = False) -> List[AssessmentResult]:
         """
         Assess multiple candidates efficiently
         
@@ -277,77 +672,116 @@ class EnhancedUniversityAssessmentEngine(UniversityAssessmentEngine):
             candidates_data: List of candidate dictionaries
             job_data: Job requirements
             include_semantic: Whether to use semantic scoring
+            include_breakdown: Whether to build each candidate's semantic breakdown
+            include_traditional: Whether to also calculate traditional scores for comparison
             
         Returns:
             List of assessment results
         """
+        return list(self.batch_assess_candidates_iter(candidates_data, job_data, include_semantic,
+                                                      include_breakdown=include_breakdown,
+                                                      include_traditional=include_traditional))
+    
+    def batch_assess_candidates_iter(self, candidates_data: List[Dict], job_data: Dict,
+                                     include_semantic: bool = True,
+                                     include_breakdown: bool = False,
+                                     include_traditional: bool = False) -> Iterator[AssessmentResult]:
+        """
+        Assess multiple candidates, yielding each result as soon as it is ready
+        
+        Consumers that write results out one at a time (CSV, database) don't
+        have to hold every result in memory.
+        
+        Args:
+            candidates_data: List of candidate dictionaries
+            job_data: Job requirements
+            include_semantic: Whether to use semantic scoring
+            include_breakdown: Whether to build each candidate's semantic breakdown
+            include_traditional: Whether to also calculate traditional scores for comparison
+            
+        Yields:
+            Assessment result for each candidate, in input order
+        """
         logger.info(f"Starting batch assessment of {len(candidates_data)} candidates")
         
-        results = []
+        assessed = 0
+        
+        # One timestamp for the whole batch instead of one per candidate
+        batch_timestamp = datetime.now().isoformat()
         
-        # Pre-compute job embedding for efficiency
-        if include_semantic and self.semantic_available and self.semantic_engine and self.semantic_engine.is_available():
+        # Pre-compute semantic details for the whole batch in one pass per component
+        batch_semantic_details = None
+        if include_semantic and self._semantic_ready:
             try:
-                job_embedding = self.semantic_engine.encode_job_requirements(job_data)
-                logger.info("Job embedding pre-computed for batch processing")
+                batch_semantic_details = self._batch_encode_candidates(candidates_data, job_data)
+                if batch_semantic_details is not None:
+                    logger.info("Semantic scores batch-encoded for all candidates")
             except Exception as e:
-                logger.warning(f"Failed to pre-compute job embedding: {e}")
-                job_embedding = None
-        else:
-            job_embedding = None
+                logger.warning(f"Failed to batch-encode candidates, scoring individually: {e}")
+                batch_semantic_details = None
         
         # Process candidates
+        total = len(candidates_data)
+        log_progress = logger.isEnabledFor(logging.INFO)
         for i, candidate_data in enumerate(candidates_data):
             try:
                 assessment = self.assess_candidate_enhanced(
                     candidate_data, job_data, 
                     include_semantic=include_semantic,
-                    include_traditional=True
+                    include_traditional=include_traditional,
+                    semantic_details=batch_semantic_details[i] if batch_semantic_details else None,
+                    assessment_timestamp=batch_timestamp,
+                    include_breakdown=include_breakdown,
+                    # Every candidate was already encoded above, so a cache hit would
+                    # only save the weighting while costing two content hashes
+                    use_result_cache=False
                 )
-                results.append(assessment)
-                
-                # Log progress for large batches
-                if len(candidates_data) > 20 and (i + 1) % 10 == 0:
-                    logger.info(f"Assessed {i + 1}/{len(candidates_data)} candidates")
-                    
             except Exception as e:
-                error_result = {
-                    'candidate_id': candidate_data.get('id', f'unknown_{i}'),
-                    'job_id': job_data.get('id'),
-                    'recommended_score': 0,
-                    'assessment_method': 'failed',
-                    'errors': [f"Assessment failed: {str(e)}"]
-                }
-                results.append(error_result)
                 logger.error(f"Failed to assess candidate {candidate_data.get('id', i)}: {e}")
+                assessment = AssessmentResult(
+                    candidate_id=candidate_data.get('id', f'unknown_{i}'),
+                    job_id=job_data.get('id'),
+                    recommended_score=0,
+                    assessment_method='failed',
+                    errors=[f"Assessment failed: {str(e)}"]
+                )
+            assessed += 1
+            
+            # Log progress for large batches
+            if log_progress and assessed % PROGRESS_EVERY == 0:
+                logger.info("Assessed %d/%d candidates", assessed, total)
+            
+            yield assessment
         
-        logger.info(f"Batch assessment completed: {len(results)} results")
-        return results
+        logger.info(f"Batch assessment completed: {assessed} results")
     
     def get_assessment_statistics(self) -> Dict:
         """Get assessment engine performance statistics"""
+        semantic_ready, model_name = self._resolve_semantic_state()
         return {
             'assessment_stats': self.assessment_stats.copy(),
-            'semantic_engine_available': self.semantic_available and self.semantic_engine and self.semantic_engine.is_available(),
-            'semantic_model': getattr(self.semantic_engine, 'model_name', 'N/A'),
+            'semantic_engine_available': semantic_ready,
+            'semantic_model': model_name,
             'semantic_weights': self.semantic_weights.copy()
         }
     
     def update_semantic_weights(self, new_weights: Dict):
         """Update semantic scoring weights"""
         # Validate weights
-        required_keys = ['education_relevance', 'experience_relevance', 'skills_relevance', 'overall_quality_bonus']
-        
-        for key in required_keys:
-            if key not in new_weights:
-                raise ValueError(f"Missing required weight: {key}")
+        missing = _REQUIRED_WEIGHTS - new_weights.keys()
+        if missing:
+            raise ValueError(f"Missing required weights: {', '.join(sorted(missing))}")
         
         # Check if weights sum to reasonable total (allowing for bonus)
-        total_weight = sum(new_weights[key] for key in required_keys[:3])  # Exclude bonus
+        total_weight = sum(map(new_weights.__getitem__, SEMANTIC_WEIGHT_KEYS[:3]))  # Exclude bonus
         if total_weight < 0.8 or total_weight > 1.2:
             logger.warning(f"Semantic weights sum to {total_weight}, expected ~1.0")
         
         self.semantic_weights.update(new_weights)
+        self._weights_snapshot = dict(self.semantic_weights)
+        # Cached results were scored with the old weights
+        with self._cache_lock:
+            self._result_cache.clear()
         logger.info(f"Updated semantic weights: {self.semantic_weights}")
     
     def _map_pds_fields_for_traditional_assessment(self, pds_data: Dict) -> Dict:
@@ -670,12 +1104,12 @@ def get_enhanced_assessment_engine() -> EnhancedUniversityAssessmentEngine:
     return _enhanced_engine
 
 # Convenience functions for compatibility
-def assess_candidate_with_semantic(candidate_data: Dict, job_data: Dict) -> Dict:
+def assess_candidate_with_semantic(candidate_data: Dict, job_data: Dict) -> AssessmentResult:
     """Assess candidate using enhanced engine with semantic scoring"""
     engine = get_enhanced_assessment_engine()
-    return engine.assess_candidate_enhanced(candidate_data, job_data)
+    return engine.assess_candidate_enhanced(candidate_data, job_data, include_traditional=False)
 
-def assess_candidates_batch(candidates_data: List[Dict], job_data: Dict) -> List[Dict]:
+def assess_candidates_batch(candidates_data: List[Dict], job_data: Dict) -> List[AssessmentResult]:
     """Batch assess candidates using enhanced engine"""
     engine = get_enhanced_assessment_engine()
     return engine.batch_assess_candidates(candidates_data, job_data)
@@ -724,7 +1158,7 @@ if __name__ == "__main__":
     }
     
     # Test enhanced assessment
-    result = engine.assess_candidate_enhanced(test_candidate, test_job)
+    result = engine.assess_candidate_enhanced(test_candidate, test_job, include_traditional=True)
     
     print(f"✅ Assessment completed:")
     print(f"   Recommended Score: {result['recommended_score']}")
@@ -13,46 +13,270 @@ import openpyxl
 from openpyxl import load_workbook
 import re
 import os
-from datetime import datetime
-import json
-from typing import List, Dict, Any, Optional
+import string
+import weakref
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from datetime import datetime, date, time
+from typing import List, Dict, Any, Optional, Tuple
 from improved_pds_extractor import ImprovedPDSExtractor
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# Patterns compiled once at import instead of looked up in re's cache per cell
+NAME_PATTERNS = [re.compile(pattern) for pattern in (
+    r'SURNAME[:\s]*([A-Za-z\s]+)',
+    r'FIRST NAME[:\s]*([A-Za-z\s]+)',
+    r'MIDDLE NAME[:\s]*([A-Za-z\s]+)',
+    # Alternative patterns
+    r'Last Name[:\s]*([A-Za-z\s]+)',
+    r'Given Name[:\s]*([A-Za-z\s]+)',
+)]
+
+PHONE_PATTERNS = [re.compile(pattern) for pattern in (
+    r'MOBILE NO[:\.\s]*([0-9\+\-\(\)\s]{10,15})',
+    r'TELEPHONE NO[:\.\s]*([0-9\+\-\(\)\s]{7,15})',
+    r'PHONE[:\.\s]*([0-9\+\-\(\)\s]{7,15})',
+    r'CONTACT[:\.\s]*([0-9\+\-\(\)\s]{7,15})',
+    # Pattern for Philippine mobile numbers
+    r'(09[0-9]{9})',
+    r'(\+639[0-9]{9})',
+)]
+
+_PHONE_RE = re.compile(r'(09[0-9]{9}|\+639[0-9]{9}|[0-9]{7,11})')
+
+# Prefixes of Philippine mobile numbers, checked in one startswith call
+MOBILE_PREFIXES = ('09', '+639')
+
+def _classify_phone(phone_number: str) -> Optional[str]:
+    """Return the personal_info field a matched phone number belongs in, if any"""
+    if phone_number.startswith(MOBILE_PREFIXES):
+        return 'mobile_no'
+    if len(phone_number) >= 7:
+        return 'telephone_no'
+    return None
+
+# Characters allowed in a name: ASCII letters, whitespace (as matched by \s), periods,
+# apostrophes and hyphens. Translating with this table deletes them all, so a
+# valid name translates to ''.
+_UNICODE_WHITESPACE = ('\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002'
+                       '\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000')
+_ALLOWED_NAME_CHARS = string.ascii_letters + ".'-" + _UNICODE_WHITESPACE
+_NAME_KILL_TABLE = str.maketrans('', '', _ALLOWED_NAME_CHARS)
+
+# Characters a validated phone number may consist of: digits, + - ( ) and whitespace
+_PHONE_CHARSET = frozenset(string.digits + '+-()' + _UNICODE_WHITESPACE)
+
+def _is_valid_email(value: str) -> bool:
+    return '@' in value and '.' in value
+
+def _is_valid_phone(value: str) -> bool:
+    return 7 <= len(value) <= 15 and _PHONE_CHARSET.issuperset(value)
+
+# personal_info fields that need more than a non-empty value, and their checks
+_FIELD_VALIDATORS = {
+    'email': _is_valid_email,
+    'mobile_no': _is_valid_phone,
+    'telephone_no': _is_valid_phone,
+    'phone': _is_valid_phone,
+}
+
+# Common non-name words found next to name labels
+_EXCLUDE_NAME_WORDS = frozenset({'NONE', 'N/A', 'NOT APPLICABLE', 'PERSONAL', 'DATA', 'SHEET'})
+
+# Keywords that mark a real civil service eligibility entry
+_ELIGIBILITY_KEYWORDS = frozenset({
+    'civil service', 'eligibility', 'examination', 'board exam',
+    'professional regulation commission', 'prc', 'licensure',
+    'career service', 'rating', 'board rating'
+})
+
+# Keywords that suggest work experience leaked into the eligibility section
+_WORK_EXPERIENCE_KEYWORDS = frozenset({
+    'company', 'corporation', 'inc', 'office', 'department',
+    'position', 'salary', 'supervisor', 'employment', 'work'
+})
+
+# Header region scanned for name and phone fields
+HEADER_SCAN_ROWS = 29
+NAME_LABEL_COLUMNS = 9     # Name labels are searched in the first 9 columns
+PHONE_SCAN_COLUMNS = 14    # Phone numbers are searched in the first 14 columns
+NAME_VALUE_OFFSETS = (1, 2, 3)  # Columns right of a name label that may hold its value
+# Name label in the header -> personal_info key it fills
+NAME_LABELS = (('SURNAME', 'surname'), ('FIRST NAME', 'first_name'), ('MIDDLE NAME', 'middle_name'))
+
+# Reference names matching this are not people: digits, business terms and
+# contact field labels, in one alternation so a name is scanned once. Terms
+# must be whole words, so names like "Vincent" or "Princess" are kept, but
+# plurals and "Incorporated" still count as business terms.
+_REF_EXCLUDE_RE = re.compile(
+    r'\d|\b(?:offices?|departments?|compan(?:y|ies)|corporations?|inc(?:orporated)?'
+    r'|address(?:es)?|telephones?|emails?|contacts?)\b', re.I)
+
+_CellValue = namedtuple('_CellValue', 'value')
+
+class WorksheetValues:
+    """
+    In-memory, values-only copy of a worksheet
+    
+    Built from a read-only openpyxl worksheet in one streaming pass. Supports
+    the subset of the Worksheet API the extractors use (cell().value,
+    max_row, max_column, iter_rows), with random access that read-only
+    worksheets can only provide by re-scanning the sheet XML.
+    """
+    
+    def __init__(self, title: str, rows: List[tuple]):
+        self.title = title
+        self.max_column = max((len(row) for row in rows), default=1) or 1
+        # Pad ragged rows so every row covers the full used range
+        self.rows = [row + (None,) * (self.max_column - len(row)) for row in rows]
+        self.max_row = len(self.rows) or 1
+    
+    @classmethod
+    def from_worksheet(cls, worksheet) -> 'WorksheetValues':
+        return cls(worksheet.title, [tuple(row) for row in worksheet.iter_rows(values_only=True)])
+    
+    @classmethod
+    def from_calamine(cls, title: str, rows: List[list]) -> 'WorksheetValues':
+        return cls(title, [tuple(map(_openpyxl_value, row)) for row in rows])
+    
+    def cell(self, row: int, column: int) -> _CellValue:
+        if 1 <= row <= len(self.rows) and 1 <= column <= self.max_column:
+            return _CellValue(self.rows[row - 1][column - 1])
+        return _CellValue(None)
+    
+    def iter_rows(self, min_row: int = None, max_row: int = None, min_col: int = None,
+                  max_col: int = None, values_only: bool = False):
+        min_row = min_row or 1
+        min_col = min_col or 1
+        max_row = max_row or self.max_row
+        max_col = max_col or self.max_column
+        # Rows are padded to max_column, so each row is one slice plus the same
+        # trailing padding for columns past the used range
+        padding = (None,) * max(0, max_col - max(self.max_column, min_col - 1))
+        empty_row = (None,) * max(0, max_col - min_col + 1)
+        row_count = len(self.rows)
+        for row in range(min_row, max_row + 1):
+            values = self.rows[row - 1][min_col - 1:max_col] + padding if row <= row_count else empty_row
+            yield values if values_only else tuple(_CellValue(value) for value in values)
+
+def _openpyxl_value(value: Any) -> Any:
+    """Convert a python-calamine cell value to the value openpyxl reads for that cell"""
+    if value == '':
+        return None  # Empty cell
+    value_type = type(value)
+    # openpyxl reads numbers written without a decimal point or exponent as int
+    if value_type is float and value.is_integer() and abs(value) < 1e15:
+        return int(value)
+    # openpyxl reads every date-formatted cell as a datetime
+    if value_type is date:
+        return datetime.combine(value, time())
+    return value
+
+PDS_SHEET_NAMES = ('C1', 'C2', 'C3', 'C4')
+WORKBOOK_CACHE_SIZE = 32
+
+@lru_cache(maxsize=WORKBOOK_CACHE_SIZE)
+def _load_pds_sheets(file_path: str, mtime_ns: int) -> Tuple[tuple, Dict[str, WorksheetValues]]:
+    """
+    Parse a PDS workbook into WorksheetValues grids, cached per (path, mtime)
+    
+    Reprocessing an unchanged file (retries, re-assessment) reuses the parsed
+    grids instead of reading the XLSX again; a modified file gets a new mtime
+    and is parsed afresh. The grids are never mutated by the extractors.
+    
+    Sheets are read with python-calamine when it is installed, with values
+    converted to the types openpyxl returns (formula error cells read as
+    empty); otherwise, and for the active sheet fallback, with openpyxl.
+    
+    Returns:
+        (sheetnames, sheets): all sheet names in the workbook, and the C1-C4
+        sheets found, or only the active sheet under None if there are none
+    """
+    if CALAMINE_AVAILABLE:
+        workbook = CalamineWorkbook.from_path(file_path)
+        try:
+            sheetnames = tuple(workbook.sheet_names)
+            sheets = {name: WorksheetValues.from_calamine(
+                          name, workbook.get_sheet_by_name(name).to_python(skip_empty_area=False))
+                      for name in PDS_SHEET_NAMES if name in sheetnames}
+        finally:
+            workbook.close()
+        if sheets:
+            return sheetnames, sheets
+    
+    # Stream the workbook once in read-only mode and keep only cell values
+    workbook = load_workbook(file_path, data_only=True, read_only=True)
+    try:
+        sheetnames = tuple(workbook.sheetnames)
+        sheets = {name: WorksheetValues.from_worksheet(workbook[name])
+                  for name in PDS_SHEET_NAMES if name in sheetnames}
+        if not sheets:
+            sheets[None] = WorksheetValues.from_worksheet(workbook.active)
+    finally:
+        workbook.close()
+    return sheetnames, sheets
+
 class EnhancedPDSExtractor(ImprovedPDSExtractor):
     """Enhanced extractor with Phase 2 fixes"""
     
     def __init__(self):
         super().__init__()
-        # Enhanced patterns for better extraction
-        self.name_patterns = [
-            r'SURNAME[:\s]*([A-Za-z\s]+)',
-            r'FIRST NAME[:\s]*([A-Za-z\s]+)',
-            r'MIDDLE NAME[:\s]*([A-Za-z\s]+)',
-            # Alternative patterns
-            r'Last Name[:\s]*([A-Za-z\s]+)',
-            r'Given Name[:\s]*([A-Za-z\s]+)',
-        ]
-        
-        self.phone_patterns = [
-            r'MOBILE NO[:\.\s]*([0-9\+\-\(\)\s]{10,15})',
-            r'TELEPHONE NO[:\.\s]*([0-9\+\-\(\)\s]{7,15})',
-            r'PHONE[:\.\s]*([0-9\+\-\(\)\s]{7,15})',
-            r'CONTACT[:\.\s]*([0-9\+\-\(\)\s]{7,15})',
-            # Pattern for Philippine mobile numbers
-            r'(09[0-9]{9})',
-            r'(\+639[0-9]{9})',
-        ]
-        
-        self.eligibility_keywords = [
-            'civil service', 'eligibility', 'examination', 'board exam', 
-            'professional regulation commission', 'prc', 'licensure',
-            'career service', 'rating', 'board rating'
-        ]
-        
-        self.work_experience_keywords = [
-            'company', 'corporation', 'inc', 'office', 'department',
-            'position', 'salary', 'supervisor', 'employment', 'work'
-        ]
+        # Enhanced patterns for better extraction (precompiled, shared by all instances)
+        self.name_patterns = NAME_PATTERNS
+        self.phone_patterns = PHONE_PATTERNS
+        
+        # Shared module-level sets; subclasses may rebind these before the automaton is built
+        self.eligibility_keywords = _ELIGIBILITY_KEYWORDS
+        self.work_experience_keywords = _WORK_EXPERIENCE_KEYWORDS
+        
+        # One automaton finds both keyword sets in a single pass over the text
+        self._keyword_automaton = self._build_keyword_automaton()
+        
+        # Cell values of each worksheet, read once and shared by every field lookup
+        self._sheet_values_cache = weakref.WeakKeyDictionary()
+    
+    def _build_keyword_automaton(self):
+        """Build an Aho-Corasick automaton over the eligibility and work keywords"""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        keywords = {}
+        for category, category_keywords in (('eligibility', self.eligibility_keywords),
+                                            ('work', self.work_experience_keywords)):
+            for keyword in category_keywords:
+                keywords.setdefault(keyword, set()).add(category)
+        for keyword, categories in keywords.items():
+            automaton.add_word(keyword, (frozenset(categories), keyword))
+        automaton.make_automaton()
+        return automaton
+    
+    def _find_keywords(self, text: str) -> Tuple[set, set]:
+        """Return the distinct eligibility and work keywords contained in text"""
+        if self._keyword_automaton is None:
+            return ({keyword for keyword in self.eligibility_keywords if keyword in text},
+                    {keyword for keyword in self.work_experience_keywords if keyword in text})
+        
+        eligibility_found = set()
+        work_found = set()
+        for _, (categories, keyword) in self._keyword_automaton.iter(text):
+            if 'eligibility' in categories:
+                eligibility_found.add(keyword)
+            if 'work' in categories:
+                work_found.add(keyword)
+        return eligibility_found, work_found
     
     def _extract_personal_info_enhanced(self, worksheet) -> Dict[str, Any]:
         """Enhanced personal info extraction with better patterns"""
@@ -62,13 +286,14 @@ class EnhancedPDSExtractor(ImprovedPDSExtractor):
             # Use the original method first
             personal_info = super()._extract_personal_info(worksheet)
             
+            # Name and phone fields come from one sweep over the header region
+            name_data, phone_data = self._scan_header_region(worksheet)
+            
             # Enhanced name extraction if original failed
             if not personal_info.get('full_name') or personal_info.get('full_name') == '':
-                name_data = self._extract_name_enhanced(worksheet)
                 personal_info.update(name_data)
             
             # Enhanced phone extraction
-            phone_data = self._extract_phone_enhanced(worksheet)
             personal_info.update(phone_data)
             
             # Clean and validate
@@ -79,53 +304,146 @@ class EnhancedPDSExtractor(ImprovedPDSExtractor):
         
         return personal_info
     
+    def _sheet_values(self, worksheet) -> Tuple[List[tuple], List[tuple]]:
+        """
+        Read a worksheet's used range once with iter_rows(values_only=True)
+        
+        Returns:
+            (rows, upper_rows): cell values per row, and the upper-cased text of
+            string cells (None elsewhere) for case-insensitive label matching
+        """
+        cached = self._sheet_values_cache.get(worksheet)
+        if cached is None:
+            rows = list(worksheet.iter_rows(min_row=1, min_col=1, values_only=True))
+            upper_rows = [tuple(value.upper() if isinstance(value, str) else None for value in row)
+                          for row in rows]
+            cached = (rows, upper_rows)
+            self._sheet_values_cache[worksheet] = cached
+        return cached
+    
+    def _get_cell_value_by_pattern(self, worksheet, pattern: str, adjacent: bool = False,
+                                   search_area: tuple = (1, 1, 100, 20)) -> Optional[str]:
+        """Find a cell containing the pattern and optionally return adjacent cell value"""
+        try:
+            rows, upper_rows = self._sheet_values(worksheet)
+            start_row, start_col, max_row, max_col = search_area
+            pattern_upper = pattern.upper()
+            
+            for row in range(start_row - 1, min(max_row, len(rows))):
+                row_upper = upper_rows[row]
+                for col in range(start_col - 1, min(max_col, len(row_upper))):
+                    cell_upper = row_upper[col]
+                    if cell_upper and pattern_upper in cell_upper:
+                        if not adjacent:
+                            return str(rows[row][col]).strip()
+                        
+                        # Try adjacent cells (right, below, two cells right)
+                        for row_offset, col_offset in ((0, 1), (0, 2), (1, 0), (0, 3)):
+                            adj_row, adj_col = row + row_offset, col + col_offset
+                            if adj_row < len(rows) and adj_col < len(rows[adj_row]):
+                                adj_value = rows[adj_row][adj_col]
+                                if adj_value and str(adj_value).strip():
+                                    # Clean and validate the value
+                                    cleaned_value = str(adj_value).strip()
+                                    # Skip if it's another field label or obviously wrong data
+                                    if self._is_valid_field_value(cleaned_value, pattern):
+                                        return cleaned_value
+        except Exception as e:
+            self.warnings.append(f"Error finding pattern '{pattern}': {str(e)}")
+        
+        return None
+    
+    def _extract_address(self, worksheet, address_type: str) -> Dict[str, Any]:
+        """Extract address information, locating the label in the cached sheet values"""
+        address = {}
+        try:
+            # Look for address components
+            if 'RESIDENTIAL' in address_type.upper():
+                base_pattern = 'RESIDENTIAL ADDRESS'
+            else:
+                base_pattern = 'PERMANENT ADDRESS'
+            
+            # The cell-by-cell scan kept the address of the last row holding the
+            # label, so search rows bottom-up and stop at the first hit
+            _, upper_rows = self._sheet_values(worksheet)
+            for row in range(len(upper_rows), 0, -1):
+                for col, text in enumerate(upper_rows[row - 1], start=1):
+                    if text is not None and base_pattern in text:
+                        address['full_address'] = self._collect_address_parts(worksheet, row, col)
+                        return address
+        except Exception as e:
+            self.warnings.append(f"Error extracting {address_type}: {str(e)}")
+        
+        return address
+    
     def _extract_name_enhanced(self, worksheet) -> Dict[str, Any]:
         """Enhanced name extraction with multiple patterns"""
+        return self._scan_header_region(worksheet)[0]
+    
+    def _extract_phone_enhanced(self, worksheet) -> Dict[str, Any]:
+        """Enhanced phone number extraction"""
+        return self._scan_header_region(worksheet)[1]
+    
+    def _scan_header_region(self, worksheet) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Extract name parts and phone numbers in a single pass over the header region
+        
+        Uses the sheet values read once by _sheet_values, so adjacent cells are
+        plain tuple lookups instead of worksheet.cell() calls, and name labels
+        are matched against the cached upper-cased text.
+        
+        Returns:
+            (name_data, phone_data)
+        """
         name_data = {}
+        phone_data = {}
         
         try:
-            # Search entire worksheet for name patterns
-            for row in range(1, min(30, worksheet.max_row + 1)):  # Search first 30 rows
-                for col in range(1, min(10, worksheet.max_column + 1)):  # Search first 10 columns
-                    cell_value = worksheet.cell(row=row, column=col).value
+            rows, upper_rows = self._sheet_values(worksheet)
+            search_phone = _PHONE_RE.search
+            names_pending = True
+            for row_values, upper_values in zip(rows[:HEADER_SCAN_ROWS], upper_rows):
+                # Stop reading once every name part and both phone kinds are known
+                if not names_pending and 'mobile_no' in phone_data and 'telephone_no' in phone_data:
+                    break
+                
+                max_col = min(PHONE_SCAN_COLUMNS, len(row_values))
+                for col, cell_value in enumerate(row_values[:max_col]):
                     if not cell_value:
                         continue
                     
-                    cell_text = str(cell_value).strip().upper()
-                    
-                    # Check for surname
-                    if 'SURNAME' in cell_text and not name_data.get('surname'):
-                        # Look in adjacent cells
-                        for offset in [1, 2, 3]:
-                            if col + offset <= worksheet.max_column:
-                                adjacent_value = worksheet.cell(row=row, column=col + offset).value
-                                if adjacent_value and str(adjacent_value).strip():
-                                    candidate_surname = str(adjacent_value).strip()
-                                    if self._is_valid_name_part(candidate_surname):
-                                        name_data['surname'] = candidate_surname
-                                        break
+                    cell_text = str(cell_value).strip()
                     
-                    # Check for first name
-                    if 'FIRST NAME' in cell_text and not name_data.get('first_name'):
-                        for offset in [1, 2, 3]:
-                            if col + offset <= worksheet.max_column:
-                                adjacent_value = worksheet.cell(row=row, column=col + offset).value
-                                if adjacent_value and str(adjacent_value).strip():
-                                    candidate_first = str(adjacent_value).strip()
-                                    if self._is_valid_name_part(candidate_first):
-                                        name_data['first_name'] = candidate_first
-                                        break
+                    # Name labels: value sits in one of the next cells to the right
+                    if names_pending and col < NAME_LABEL_COLUMNS:
+                        # Only string cells can hold a label
+                        label_text = upper_values[col] or ''
+                        
+                        for label, key in NAME_LABELS:
+                            if label in label_text and key not in name_data:
+                                for offset in NAME_VALUE_OFFSETS:
+                                    if col + offset < max_col:
+                                        adjacent_value = row_values[col + offset]
+                                        if adjacent_value and str(adjacent_value).strip():
+                                            candidate = str(adjacent_value).strip()
+                                            if self._is_valid_name_part(candidate):
+                                                name_data[key] = candidate
+                                                break
+                        
+                        names_pending = len(name_data) < 3
                     
-                    # Check for middle name
-                    if 'MIDDLE NAME' in cell_text and not name_data.get('middle_name'):
-                        for offset in [1, 2, 3]:
-                            if col + offset <= worksheet.max_column:
-                                adjacent_value = worksheet.cell(row=row, column=col + offset).value
-                                if adjacent_value and str(adjacent_value).strip():
-                                    candidate_middle = str(adjacent_value).strip()
-                                    if self._is_valid_name_part(candidate_middle):
-                                        name_data['middle_name'] = candidate_middle
-                                        break
+                    # Check for mobile/phone numbers
+                    phone_match = search_phone(cell_text)
+                    if phone_match:
+                        phone_number = phone_match.group(1)
+                        phone_field = _classify_phone(phone_number)
+                        if phone_field and phone_field not in phone_data:
+                            phone_data[phone_field] = phone_number
+                            # The mobile number is the generic 'phone'; a telephone only fills in for it
+                            if phone_field == 'mobile_no':
+                                phone_data['phone'] = phone_number
+                            else:
+                                phone_data.setdefault('phone', phone_number)
             
             # Create full name
             if name_data.get('first_name') or name_data.get('surname'):
@@ -141,78 +459,40 @@ class EnhancedPDSExtractor(ImprovedPDSExtractor):
                 name_data['name'] = name_data['full_name']  # Also set 'name' field
                 
         except Exception as e:
-            self.warnings.append(f"Enhanced name extraction error: {str(e)}")
-        
-        return name_data
-    
-    def _extract_phone_enhanced(self, worksheet) -> Dict[str, Any]:
-        """Enhanced phone number extraction"""
-        phone_data = {}
-        
-        try:
-            # Search for phone patterns in worksheet
-            for row in range(1, min(30, worksheet.max_row + 1)):
-                for col in range(1, min(15, worksheet.max_column + 1)):
-                    cell_value = worksheet.cell(row=row, column=col).value
-                    if not cell_value:
-                        continue
-                    
-                    cell_text = str(cell_value).strip()
-                    
-                    # Check for mobile/phone numbers
-                    phone_match = re.search(r'(09[0-9]{9}|\+639[0-9]{9}|[0-9]{7,11})', cell_text)
-                    if phone_match:
-                        phone_number = phone_match.group(1)
-                        
-                        # Determine if it's mobile or telephone
-                        if phone_number.startswith('09') or phone_number.startswith('+639'):
-                            if not phone_data.get('mobile_no'):
-                                phone_data['mobile_no'] = phone_number
-                                phone_data['phone'] = phone_number  # Also set generic 'phone' field
-                        elif len(phone_number) >= 7:
-                            if not phone_data.get('telephone_no'):
-                                phone_data['telephone_no'] = phone_number
-                                if not phone_data.get('phone'):  # Use as generic phone if mobile not found
-                                    phone_data['phone'] = phone_number
-                        
-        except Exception as e:
-            self.warnings.append(f"Enhanced phone extraction error: {str(e)}")
+            self.warnings.append(f"Enhanced header scan error: {str(e)}")
         
-        return phone_data
+        return name_data, phone_data
     
     def _is_valid_name_part(self, text: str) -> bool:
         """Validate if text looks like a name part"""
-        if not text or len(text.strip()) < 2:
+        if not text:
+            return False
+        text = text.strip()
+        if len(text) < 2:
             return False
         
         # Check if it contains only letters, spaces, periods, and common name characters
-        if not re.match(r'^[A-Za-z\s\.\'-]+$', text.strip()):
+        if text.translate(_NAME_KILL_TABLE):
             return False
         
         # Exclude common non-name words
-        exclude_words = ['NONE', 'N/A', 'NOT APPLICABLE', 'PERSONAL', 'DATA', 'SHEET']
-        if text.strip().upper() in exclude_words:
-            return False
-        
-        return True
+        return text.upper() not in _EXCLUDE_NAME_WORDS
     
     def _validate_personal_info(self, personal_info: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and clean personal information"""
         cleaned = {}
         
         for key, value in personal_info.items():
-            if value and str(value).strip() and str(value).strip() != 'None':
-                cleaned_value = str(value).strip()
-                
-                # Additional validation for specific fields
-                if key in ['email']:
-                    if '@' in cleaned_value and '.' in cleaned_value:
-                        cleaned[key] = cleaned_value
-                elif key in ['mobile_no', 'telephone_no', 'phone']:
-                    if re.match(r'^[0-9\+\-\(\)\s]{7,15}$', cleaned_value):
-                        cleaned[key] = cleaned_value
-                else:
-                    cleaned[key] = cleaned_value
+            if not value:
+                continue
+            cleaned_value = str(value).strip()
+            if not cleaned_value or cleaned_value == 'None':
+                continue
+            
+            # Additional validation for specific fields
+            validator = _FIELD_VALIDATORS.get(key)
+            if validator is None or validator(cleaned_value):
+                cleaned[key] = cleaned_value
         
         return cleaned
     
@@ -221,11 +501,8 @@ class EnhancedPDSExtractor(ImprovedPDSExtractor):
         eligibility_entries = []
         
         try:
-            # Use original method first
-            original_entries = super()._extract_civil_service_eligibility(worksheet)
-            
-            # Filter and validate each entry
-            for entry in original_entries:
+            # Filter and validate each entry as the original parser yields it
+            for entry in self._iter_civil_service_eligibility(worksheet):
                 if self._is_valid_eligibility_entry(entry):
                     eligibility_entries.append(entry)
                 else:
@@ -247,19 +524,23 @@ class EnhancedPDSExtractor(ImprovedPDSExtractor):
         if not eligibility_text or len(eligibility_text.strip()) < 3:
             return False
         
-        # Check if it contains eligibility-related keywords
-        has_eligibility_keywords = any(keyword in eligibility_text for keyword in self.eligibility_keywords)
-        
-        # Check if it contains work experience keywords (bad sign)
-        has_work_keywords = any(keyword in eligibility_text for keyword in self.work_experience_keywords)
+        # Check for eligibility-related keywords and work experience keywords (bad sign)
+        eligibility_found, work_found = self._find_keywords(eligibility_text)
+        has_eligibility_keywords = bool(eligibility_found)
+        has_work_keywords = bool(work_found)
         
         # Reject if it has work keywords but no eligibility keywords
         if has_work_keywords and not has_eligibility_keywords:
             return False
         
-        # Additional validation: check other fields
-        entry_text = json.dumps(entry).lower()
-        work_contamination_score = sum(1 for keyword in self.work_experience_keywords if keyword in entry_text)
+        # Additional validation: check other fields' values directly instead
+        # of serializing the whole entry to JSON. The eligibility text was
+        # already lowered and scanned above, so its work keywords are reused;
+        # the rest are joined on newlines (no keyword spans one) and scanned once.
+        other_text = '\n'.join(value for key, value in entry.items()
+                               if key != 'eligibility' and isinstance(value, str))
+        work_found |= self._find_keywords(other_text.lower())[1]
+        work_contamination_score = len(work_found)
         
         # If too many work-related terms, probably contaminated
         if work_contamination_score > 2:
@@ -297,57 +578,49 @@ class EnhancedPDSExtractor(ImprovedPDSExtractor):
         
         # Check if it looks like a person's name
         # Should contain letters and spaces, possibly periods
-        if not re.match(r'^[A-Za-z\s\.\'-]+$', name):
+        if name.translate(_NAME_KILL_TABLE):
             return False
         
-        # Should have at least 2 parts (first and last name)
-        name_parts = name.split()
-        if len(name_parts) < 2:
+        # Should have at least 2 parts (first and last name); splitting once is
+        # enough to tell, without splitting the whole name
+        if len(name.split(maxsplit=1)) < 2:
             return False
         
         # Exclude obvious non-names
-        exclude_patterns = [
-            r'\d+',  # Contains numbers
-            r'(office|department|company|corporation|inc)',  # Business terms
-            r'(address|telephone|email|contact)',  # Contact field labels
-        ]
-        
-        for pattern in exclude_patterns:
-            if re.search(pattern, name.lower()):
-                return False
-        
-        return True
+        return not _REF_EXCLUDE_RE.search(name)
     
     # Override main extraction method to use enhanced versions
     def _extract_from_excel(self, file_path: str) -> Dict[str, Any]:
         """Enhanced Excel extraction using improved methods"""
         try:
-            workbook = load_workbook(file_path, data_only=True)
+            # The extractors work on in-memory WorksheetValues grids, parsed once
+            # per file version and shared by repeated extractions of that file
+            sheetnames, sheets = _load_pds_sheets(file_path, os.stat(file_path).st_mtime_ns)
             
             # Extract from different sheets
-            if 'C1' in workbook.sheetnames:
-                c1_sheet = workbook['C1']
+            if 'C1' in sheets:
+                c1_sheet = sheets['C1']
                 self.pds_data['personal_info'] = self._extract_personal_info_enhanced(c1_sheet)
                 self.pds_data['family_background'] = self._extract_family_background(c1_sheet)
                 self.pds_data['educational_background'] = self._extract_educational_background(c1_sheet)
             
-            if 'C2' in workbook.sheetnames:
-                c2_sheet = workbook['C2']
+            if 'C2' in sheets:
+                c2_sheet = sheets['C2']
                 self.pds_data['civil_service_eligibility'] = self._extract_civil_service_eligibility_enhanced(c2_sheet)
                 self.pds_data['work_experience'] = self._extract_work_experience(c2_sheet)
             
-            if 'C3' in workbook.sheetnames:
-                c3_sheet = workbook['C3']
+            if 'C3' in sheets:
+                c3_sheet = sheets['C3']
                 self.pds_data['voluntary_work'] = self._extract_voluntary_work(c3_sheet)
                 self.pds_data['learning_development'] = self._extract_learning_development(c3_sheet)
                 
-            if 'C4' in workbook.sheetnames:
-                c4_sheet = workbook['C4']
+            if 'C4' in sheets:
+                c4_sheet = sheets['C4']
                 self.pds_data['other_information'] = self._extract_other_information_enhanced(c4_sheet)
             
             # If no C1-C4 sheets, try first sheet
-            if not any(sheet in workbook.sheetnames for sheet in ['C1', 'C2', 'C3', 'C4']):
-                first_sheet = workbook.active
+            if None in sheets:
+                first_sheet = sheets[None]
                 self.pds_data['personal_info'] = self._extract_personal_info_enhanced(first_sheet)
                 self.pds_data['family_background'] = self._extract_family_background(first_sheet)
                 self.pds_data['educational_background'] = self._extract_educational_background(first_sheet)
@@ -362,15 +635,37 @@ class EnhancedPDSExtractor(ImprovedPDSExtractor):
                 'file_type': 'XLSX',
                 'extraction_method': 'enhanced_table_parsing',
                 'extracted_at': datetime.now().isoformat(),
-                'sheets_found': workbook.sheetnames,
+                'sheets_found': list(sheetnames),
                 'errors': self.errors,
                 'warnings': self.warnings,
                 'enhancement_version': 'phase2_v1.0'
             }
             
-            workbook.close()
             return self.pds_data
             
         except Exception as e:
             self.errors.append(f"Enhanced Excel extraction error: {str(e)}")
             return {}
+
+
+def extract_one(file_path: str) -> Dict[str, Any]:
+    """Extract a single PDS file with a fresh extractor (picklable pool task)"""
+    return EnhancedPDSExtractor().extract_pds_data(file_path)
+
+
+def extract_many(file_paths: List[str], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Extract several PDS files in parallel worker processes
+    
+    Parsing is CPU-bound and holds the GIL, so files are spread over processes
+    rather than threads. Results are returned in the order of file_paths.
+    """
+    file_paths = list(file_paths)
+    if len(file_paths) < 2:
+        return [extract_one(file_path) for file_path in file_paths]
+    
+    workers = max_workers or os.cpu_count() or 1
+    # Batch tasks to cut pickling round-trips while still keeping every worker busy
+    chunksize = max(1, min(4, len(file_paths) // workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(extract_one, file_paths, chunksize=chunksize))
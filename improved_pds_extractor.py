@@ -12,7 +12,7 @@ import re
 import os
 from datetime import datetime
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 import PyPDF2
 
 class ImprovedPDSExtractor:
@@ -240,8 +240,10 @@ class ImprovedPDSExtractor:
     
     def _extract_civil_service_eligibility(self, worksheet) -> List[Dict[str, Any]]:
         """Extract Section IV Civil Service Eligibility"""
-        eligibility_entries = []
-        
+        return list(self._iter_civil_service_eligibility(worksheet))
+    
+    def _iter_civil_service_eligibility(self, worksheet) -> Iterator[Dict[str, Any]]:
+        """Yield Section IV Civil Service Eligibility entries as they are parsed"""
         try:
             # Find civil service eligibility section
             eligibility_start_row = None
@@ -255,7 +257,7 @@ class ImprovedPDSExtractor:
                     break
             
             if not eligibility_start_row:
-                return eligibility_entries
+                return
             
             # Look for eligibility entries in the following rows
             current_row = eligibility_start_row + 3
@@ -291,12 +293,10 @@ class ImprovedPDSExtractor:
                     
                     # Only add if it looks like actual eligibility data
                     if entry['eligibility'] and not entry['eligibility'].isdigit():
-                        eligibility_entries.append(entry)
+                        yield entry
         
         except Exception as e:
             self.errors.append(f"Error extracting civil service eligibility: {str(e)}")
-        
-        return eligibility_entries
     
     def _extract_work_experience(self, worksheet) -> List[Dict[str, Any]]:
         """Extract Section V Work Experience"""
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+JSON report writer shared by the phase analysis scripts
+"""
+
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def write_json_report(path, data, default=None):
+    """Write data as indented JSON, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        # orjson writes numpy scalars and arrays natively instead of via default
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=options, default=default))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=default)
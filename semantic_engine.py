@@ -23,6 +23,16 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+# Encoder precisions accepted by UniversitySemanticEngine.set_precision
+SEMANTIC_PRECISIONS = ('fp32', 'fp16', 'bf16')
+
+# Cache contexts for the job-side text each candidate component is compared against
+JOB_COMPARISON_CONTEXTS = {
+    'education': 'job_edu_comparison',
+    'experience': 'job_exp_comparison',
+    'training': 'job_training_comparison'
+}
+
 class UniversitySemanticEngine:
     """
     Semantic engine for university job-candidate matching using sentence transformers
@@ -50,6 +60,7 @@ class UniversitySemanticEngine:
         self.batch_size = 32
         self.similarity_threshold = 0.3
         self.offline_mode = False  # Flag for offline mode when model can't load
+        self.precision = 'fp32'  # Encoder weight precision, see set_precision
         
         # Create cache directory
         os.makedirs(cache_dir, exist_ok=True)
@@ -93,9 +104,54 @@ class UniversitySemanticEngine:
         """Check if semantic engine is available and ready"""
         return SEMANTIC_DEPENDENCIES_AVAILABLE or self.offline_mode  # Can work with or without model
     
+    def set_precision(self, precision: str) -> bool:
+        """
+        Run the encoder in reduced precision on hardware that supports it
+        
+        fp16 needs a CUDA device; bf16 needs a CUDA device with bf16 support
+        or a CPU with AVX-512 BF16. Unsupported requests keep the current precision.
+        
+        Args:
+            precision: One of 'fp32', 'fp16', 'bf16'
+            
+        Returns:
+            True if the encoder now runs in the requested precision
+        """
+        if precision not in SEMANTIC_PRECISIONS:
+            raise ValueError(f"Unknown semantic precision: {precision}")
+        if precision == self.precision:
+            return True
+        if self.model is None:
+            return False
+        
+        try:
+            import torch
+            
+            cuda = torch.cuda.is_available()
+            if precision == 'fp16' and not cuda:
+                logger.warning("fp16 encoding needs a CUDA device, keeping fp32")
+                return False
+            if precision == 'bf16':
+                cpu_bf16 = getattr(torch.cpu, '_is_avx512_bf16_supported', lambda: False)
+                if not (torch.cuda.is_bf16_supported() if cuda else cpu_bf16()):
+                    logger.warning("bf16 encoding not supported on this hardware, keeping fp32")
+                    return False
+            
+            dtypes = {'fp32': torch.float32, 'fp16': torch.float16, 'bf16': torch.bfloat16}
+            self.model.to(dtypes[precision])
+            self.precision = precision
+            logger.info(f"Semantic model running in {precision}")
+            return True
+            
+        except Exception as e:
+            logger.warning(f"Failed to switch semantic model to {precision}: {e}")
+            return False
+    
     def _generate_cache_key(self, text: str, context: str = "") -> str:
         """Generate cache key for embeddings"""
-        combined = f"{text}_{context}_{self.model_name}"
+        # Reduced-precision embeddings are cached apart from fp32 ones
+        model_tag = self.model_name if self.precision == 'fp32' else f"{self.model_name}@{self.precision}"
+        combined = f"{text}_{context}_{model_tag}"
         return hashlib.md5(combined.encode()).hexdigest()
     
     def _save_embedding_cache(self, cache_type: str = "both"):
@@ -186,6 +242,104 @@ class UniversitySemanticEngine:
             logger.error(f"Failed to encode text: {e}")
             return None
     
+    def encode_texts(self, texts: List[str], context: Union[str, List[str]] = "",
+                     use_cache: bool = True) -> Optional[np.ndarray]:
+        """
+        Encode many texts with a single model call, reusing cached embeddings
+        
+        Args:
+            texts: Texts to encode
+            context: Additional context for caching, shared or one per text
+            use_cache: Whether to use/update cache
+            
+        Returns:
+            Matrix with one embedding row per text, or None if failed
+        """
+        if not self.is_available() or self.model is None or not texts:
+            return None
+        
+        contexts = [context] * len(texts) if isinstance(context, str) else context
+        embeddings = [None] * len(texts)
+        cache_keys = [None] * len(texts)
+        pending = []
+        
+        # Check cache first
+        for i, (text, text_context) in enumerate(zip(texts, contexts)):
+            if use_cache:
+                cache_keys[i] = self._generate_cache_key(text, text_context)
+                if cache_keys[i] in self.candidate_embeddings_cache:
+                    embeddings[i] = self.candidate_embeddings_cache[cache_keys[i]]
+                    continue
+            pending.append(i)
+        
+        try:
+            if pending:
+                # Generate all missing embeddings in one forward pass
+                encoded = self.model.encode(
+                    [texts[i][:self.max_sequence_length] for i in pending],
+                    batch_size=self.batch_size,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True
+                )
+                
+                for i, embedding in zip(pending, encoded):
+                    embeddings[i] = embedding
+                    if use_cache:
+                        self.candidate_embeddings_cache[cache_keys[i]] = embedding
+            
+            # fp16/bf16 encoders return low-precision rows; score in fp32
+            return np.vstack(embeddings).astype(np.float32, copy=False)
+            
+        except Exception as e:
+            logger.error(f"Failed to batch encode texts: {e}")
+            return None
+    
+    def build_job_text(self, job_data: Dict) -> str:
+        """Build the combined job text used for the overall job embedding"""
+        title = job_data.get('title', '')
+        description = job_data.get('description', '')
+        requirements = job_data.get('requirements', '')
+        department = job_data.get('department', '')
+        experience_level = job_data.get('experience_level', '')
+        
+        # Create comprehensive job text
+        job_text_parts = []
+        if title:
+            job_text_parts.append(f"Job Title: {title}")
+        if department:
+            job_text_parts.append(f"Department: {department}")
+        if experience_level:
+            job_text_parts.append(f"Experience Level: {experience_level}")
+        if description:
+            job_text_parts.append(f"Description: {description}")
+        if requirements:
+            job_text_parts.append(f"Requirements: {requirements}")
+        
+        return " | ".join(job_text_parts)
+    
+    def build_job_comparison_text(self, job_data: Dict, component: str) -> str:
+        """Build the job-side text a candidate component is compared against"""
+        if component == 'education':
+            # Focus on educational requirements
+            return f"{job_data.get('title', '')} {job_data.get('requirements', '')}"
+        return f"{job_data.get('title', '')} {job_data.get('description', '')} {job_data.get('requirements', '')}"
+    
+    def encode_job_components(self, job_data: Dict) -> Dict[str, Optional[np.ndarray]]:
+        """
+        Encode every job-side text used by the detailed semantic score
+        
+        Args:
+            job_data: Dictionary containing job information
+            
+        Returns:
+            Embeddings keyed by 'overall', 'education', 'experience' and 'training'
+        """
+        embeddings = {'overall': self.encode_job_requirements(job_data)}
+        for component, context in JOB_COMPARISON_CONTEXTS.items():
+            job_text = self.build_job_comparison_text(job_data, component)
+            embeddings[component] = self.encode_text(job_text, context)
+        return embeddings
+    
     def encode_job_requirements(self, job_data: Dict) -> Optional[np.ndarray]:
         """
         Encode job requirements into embedding vector
@@ -202,26 +356,7 @@ class UniversitySemanticEngine:
         try:
             # Extract job information
             job_id = job_data.get('id', 'unknown')
-            title = job_data.get('title', '')
-            description = job_data.get('description', '')
-            requirements = job_data.get('requirements', '')
-            department = job_data.get('department', '')
-            experience_level = job_data.get('experience_level', '')
-            
-            # Create comprehensive job text
-            job_text_parts = []
-            if title:
-                job_text_parts.append(f"Job Title: {title}")
-            if department:
-                job_text_parts.append(f"Department: {department}")
-            if experience_level:
-                job_text_parts.append(f"Experience Level: {experience_level}")
-            if description:
-                job_text_parts.append(f"Description: {description}")
-            if requirements:
-                job_text_parts.append(f"Requirements: {requirements}")
-            
-            job_text = " | ".join(job_text_parts)
+            job_text = self.build_job_text(job_data)
             
             # Check cache
             cache_key = self._generate_cache_key(job_text, f"job_{job_id}")
@@ -242,6 +377,126 @@ class UniversitySemanticEngine:
             logger.error(f"Failed to encode job requirements: {e}")
             return None
     
+    def build_candidate_profile_text(self, candidate_data: Dict) -> str:
+        """Build the combined candidate profile text from the PDS structure"""
+        # Extract candidate information using PDS structure
+        profile_parts = []
+        
+        # Educational Background (from PDS structure)
+        educational_background = candidate_data.get('educational_background', [])
+        if not educational_background:
+            # Fallback to converted format
+            education = candidate_data.get('education', [])
+            if education and isinstance(education, list):
+                for edu in education[:4]:  # Top 4 education entries
+                    if isinstance(edu, dict):
+                        degree = edu.get('degree', '')
+                        school = edu.get('school', '')
+                        level = edu.get('level', '')
+                        if degree or school:
+                            profile_parts.append(f"Education: {level} {degree} from {school}")
+        else:
+            # Use direct PDS structure
+            if isinstance(educational_background, list):
+                for edu in educational_background[:4]:  # Include more education entries
+                    if isinstance(edu, dict):
+                        level = edu.get('level', '')
+                        degree_course = edu.get('degree_course', edu.get('degree', ''))  # Support both field names
+                        school = edu.get('school', '')
+                        honors = edu.get('honors', '')
+                        if degree_course or school:
+                            edu_text = f"Education: {level} {degree_course} from {school}"
+                            if honors and honors != 'N/a':
+                                edu_text += f" with {honors}"
+                            profile_parts.append(edu_text)
+        
+        # Work Experience (from PDS structure)
+        work_experience = candidate_data.get('work_experience', [])
+        if not work_experience:
+            # Fallback to converted format
+            experience = candidate_data.get('experience', [])
+            if experience and isinstance(experience, list):
+                for exp in experience[:4]:  # Top 4 work experiences
+                    if isinstance(exp, dict):
+                        position = exp.get('position', '')
+                        company = exp.get('company', '')
+                        description = exp.get('description', '')
+                        if position or company:
+                            exp_text = f"Experience: {position} at {company}"
+                            if description:
+                                exp_text += f" - {description[:100]}"
+                            profile_parts.append(exp_text)
+        else:
+            # Use direct PDS structure
+            if isinstance(work_experience, list):
+                for exp in work_experience[:4]:  # Include more experience entries
+                    if isinstance(exp, dict):
+                        position = exp.get('position', '')
+                        company = exp.get('company', '')
+                        salary = exp.get('salary', '')
+                        grade = exp.get('grade', '')
+                        if position or company:
+                            exp_text = f"Experience: {position} at {company}"
+                            if grade and grade != 'N/A':
+                                exp_text += f" ({grade})"
+                            profile_parts.append(exp_text)
+        
+        # Learning and Development (Training from PDS)
+        learning_development = candidate_data.get('learning_development', [])
+        if not learning_development:
+            # Fallback to converted format
+            training = candidate_data.get('training', [])
+            if training and isinstance(training, list):
+                for cert in training[:3]:  # Top 3 trainings
+                    if isinstance(cert, dict):
+                        title = cert.get('title', '')
+                        if title:
+                            profile_parts.append(f"Training: {title}")
+        else:
+            # Use direct PDS structure
+            for train in learning_development[:3]:  # Top 3 training entries
+                if isinstance(train, dict):
+                    title = train.get('title', '')
+                    type_info = train.get('type', '')
+                    hours = train.get('hours', '')
+                    if title:
+                        train_text = f"Training: {title}"
+                        if type_info and type_info != 'N/a':
+                            train_text += f" ({type_info})"
+                        if hours:
+                            train_text += f" - {hours} hours"
+                        profile_parts.append(train_text)
+        
+        # Civil Service Eligibility (unique to PDS)
+        civil_service = candidate_data.get('civil_service_eligibility', [])
+        if civil_service and isinstance(civil_service, list):
+            for elig in civil_service[:2]:  # Top 2 eligibilities
+                if isinstance(elig, dict):
+                    eligibility = elig.get('eligibility', '')
+                    rating = elig.get('rating', '')
+                    if eligibility:
+                        elig_text = f"Eligibility: {eligibility}"
+                        if rating and rating != '':
+                            try:
+                                rating_pct = float(rating) * 100
+                                elig_text += f" (Rating: {rating_pct:.1f}%)"
+                            except:
+                                pass
+                        profile_parts.append(elig_text)
+        
+        # PDS Personal Info (relevant details only)
+        pds_data = candidate_data.get('pds_data', {})
+        if pds_data and isinstance(pds_data, dict):
+            personal_info = pds_data.get('personal_info', {})
+            if personal_info:
+                # Add citizenship if relevant for government positions
+                citizenship = personal_info.get('citizenship', '')
+                if citizenship and citizenship not in ['N/a', 'please indicate the details.']:
+                    profile_parts.append(f"Citizenship: {citizenship}")
+        
+        # Combine all parts
+        return " | ".join(profile_parts)
+    
     def encode_candidate_profile(self, candidate_data: Dict) -> Optional[np.ndarray]:
         """
         Encode candidate profile into embedding vector using actual PDS structure
@@ -258,123 +513,7 @@ class UniversitySemanticEngine:
         try:
             candidate_id = candidate_data.get('id', 'unknown')
             
-            # Extract candidate information using PDS structure
-            profile_parts = []
-            
-            # Educational Background (from PDS structure)
-            educational_background = candidate_data.get('educational_background', [])
-            if not educational_background:
-                # Fallback to converted format
-                education = candidate_data.get('education', [])
-                if education and isinstance(education, list):
-                    for edu in education[:4]:  # Top 4 education entries
-                        if isinstance(edu, dict):
-                            degree = edu.get('degree', '')
-                            school = edu.get('school', '')
-                            level = edu.get('level', '')
-                            if degree or school:
-                                profile_parts.append(f"Education: {level} {degree} from {school}")
-            else:
-                # Use direct PDS structure
-                if isinstance(educational_background, list):
-                    for edu in educational_background[:4]:  # Include more education entries
-                        if isinstance(edu, dict):
-                            level = edu.get('level', '')
-                            degree_course = edu.get('degree_course', edu.get('degree', ''))  # Support both field names
-                            school = edu.get('school', '')
-                            honors = edu.get('honors', '')
-                            if degree_course or school:
-                                edu_text = f"Education: {level} {degree_course} from {school}"
-                                if honors and honors != 'N/a':
-                                    edu_text += f" with {honors}"
-                                profile_parts.append(edu_text)
-            
-            # Work Experience (from PDS structure)
-            work_experience = candidate_data.get('work_experience', [])
-            if not work_experience:
-                # Fallback to converted format
-                experience = candidate_data.get('experience', [])
-                if experience and isinstance(experience, list):
-                    for exp in experience[:4]:  # Top 4 work experiences
-                        if isinstance(exp, dict):
-                            position = exp.get('position', '')
-                            company = exp.get('company', '')
-                            description = exp.get('description', '')
-                            if position or company:
-                                exp_text = f"Experience: {position} at {company}"
-                                if description:
-                                    exp_text += f" - {description[:100]}"
-                                profile_parts.append(exp_text)
-            else:
-                # Use direct PDS structure
-                if isinstance(work_experience, list):
-                    for exp in work_experience[:4]:  # Include more experience entries
-                        if isinstance(exp, dict):
-                            position = exp.get('position', '')
-                            company = exp.get('company', '')
-                            salary = exp.get('salary', '')
-                            grade = exp.get('grade', '')
-                            if position or company:
-                                exp_text = f"Experience: {position} at {company}"
-                                if grade and grade != 'N/A':
-                                    exp_text += f" ({grade})"
-                                profile_parts.append(exp_text)
-            
-            # Learning and Development (Training from PDS)
-            learning_development = candidate_data.get('learning_development', [])
-            if not learning_development:
-                # Fallback to converted format
-                training = candidate_data.get('training', [])
-                if training and isinstance(training, list):
-                    for cert in training[:3]:  # Top 3 trainings
-                        if isinstance(cert, dict):
-                            title = cert.get('title', '')
-                            if title:
-                                profile_parts.append(f"Training: {title}")
-            else:
-                # Use direct PDS structure
-                for train in learning_development[:3]:  # Top 3 training entries
-                    if isinstance(train, dict):
-                        title = train.get('title', '')
-                        type_info = train.get('type', '')
-                        hours = train.get('hours', '')
-                        if title:
-                            train_text = f"Training: {title}"
-                            if type_info and type_info != 'N/a':
-                                train_text += f" ({type_info})"
-                            if hours:
-                                train_text += f" - {hours} hours"
-                            profile_parts.append(train_text)
-            
-            # Civil Service Eligibility (unique to PDS)
-            civil_service = candidate_data.get('civil_service_eligibility', [])
-            if civil_service and isinstance(civil_service, list):
-                for elig in civil_service[:2]:  # Top 2 eligibilities
-                    if isinstance(elig, dict):
-                        eligibility = elig.get('eligibility', '')
-                        rating = elig.get('rating', '')
-                        if eligibility:
-                            elig_text = f"Eligibility: {eligibility}"
-                            if rating and rating != '':
-                                try:
-                                    rating_pct = float(rating) * 100
-                                    elig_text += f" (Rating: {rating_pct:.1f}%)"
-                                except:
-                                    pass
-                            profile_parts.append(elig_text)
-            
-            # PDS Personal Info (relevant details only)
-            pds_data = candidate_data.get('pds_data', {})
-            if pds_data and isinstance(pds_data, dict):
-                personal_info = pds_data.get('personal_info', {})
-                if personal_info:
-                    # Add citizenship if relevant for government positions
-                    citizenship = personal_info.get('citizenship', '')
-                    if citizenship and citizenship not in ['N/a', 'please indicate the details.']:
-                        profile_parts.append(f"Citizenship: {citizenship}")
-            
-            # Combine all parts
-            candidate_text = " | ".join(profile_parts)
+            candidate_text = self.build_candidate_profile_text(candidate_data)
             
             if not candidate_text.strip():
                 logger.warning(f"No meaningful text extracted for candidate {candidate_id}")
@@ -526,54 +665,59 @@ class UniversitySemanticEngine:
                 'error': str(e)
             }
     
+    def build_education_text(self, candidate_data: Dict) -> str:
+        """Build the candidate education text compared against job requirements"""
+        # Extract education from PDS structure
+        educational_background = candidate_data.get('educational_background', [])
+        education = candidate_data.get('education', [])  # Fallback to converted format
+        
+        education_texts = []
+        
+        # Use PDS educational_background first
+        if educational_background and isinstance(educational_background, list):
+            for edu in educational_background[:4]:  # Include more education entries
+                if isinstance(edu, dict):
+                    level = edu.get('level', '')
+                    degree_course = edu.get('degree_course', edu.get('degree', ''))  # Support both field names
+                    school = edu.get('school', '')
+                    honors = edu.get('honors', '')
+                    year_graduated = edu.get('year_graduated', '')
+                    
+                    if degree_course or school:
+                        edu_text = f"{level} {degree_course} from {school}"
+                        if honors and honors not in ['N/a', '']:
+                            edu_text += f" with {honors}"
+                        if year_graduated:
+                            edu_text += f" (graduated {year_graduated})"
+                        education_texts.append(edu_text)
+        
+        # Fallback to converted education format
+        elif education:
+            for edu in education[:4]:
+                if isinstance(edu, dict):
+                    degree = edu.get('degree', '')
+                    school = edu.get('school', '')
+                    level = edu.get('level', '')
+                    if degree or school:
+                        edu_text = f"{level} {degree} from {school}".strip()
+                        education_texts.append(edu_text)
+        
+        return " | ".join(education_texts)
+    
     def _calculate_education_relevance(self, candidate_data: Dict, job_data: Dict) -> float:
         """Calculate education-specific relevance using PDS structure"""
         try:
-            # Extract education from PDS structure
-            educational_background = candidate_data.get('educational_background', [])
-            education = candidate_data.get('education', [])  # Fallback to converted format
-            
-            education_texts = []
-            
-            # Use PDS educational_background first
-            if educational_background and isinstance(educational_background, list):
-                for edu in educational_background[:4]:  # Include more education entries
-                    if isinstance(edu, dict):
-                        level = edu.get('level', '')
-                        degree_course = edu.get('degree_course', edu.get('degree', ''))  # Support both field names
-                        school = edu.get('school', '')
-                        honors = edu.get('honors', '')
-                        year_graduated = edu.get('year_graduated', '')
-                        
-                        if degree_course or school:
-                            edu_text = f"{level} {degree_course} from {school}"
-                            if honors and honors not in ['N/a', '']:
-                                edu_text += f" with {honors}"
-                            if year_graduated:
-                                edu_text += f" (graduated {year_graduated})"
-                            education_texts.append(edu_text)
-            
-            # Fallback to converted education format
-            elif education:
-                for edu in education[:4]:
-                    if isinstance(edu, dict):
-                        degree = edu.get('degree', '')
-                        school = edu.get('school', '')
-                        level = edu.get('level', '')
-                        if degree or school:
-                            edu_text = f"{level} {degree} from {school}".strip()
-                            education_texts.append(edu_text)
+            candidate_edu_text = self.build_education_text(candidate_data)
             
-            if not education_texts:
+            if not candidate_edu_text:
                 return 0.0
             
             # Job requirements - focus on educational requirements
-            job_text = f"{job_data.get('title', '')} {job_data.get('requirements', '')}"
+            job_text = self.build_job_comparison_text(job_data, 'education')
             
             # Calculate similarity
-            candidate_edu_text = " | ".join(education_texts)
             edu_embedding = self.encode_text(candidate_edu_text, "education")
-            job_embedding = self.encode_text(job_text, "job_edu_comparison")
+            job_embedding = self.encode_text(job_text, JOB_COMPARISON_CONTEXTS['education'])
             
             if edu_embedding is None or job_embedding is None:
                 return 0.0
@@ -584,55 +728,60 @@ class UniversitySemanticEngine:
             logger.error(f"Failed to calculate education relevance: {e}")
             return 0.0
     
+    def build_experience_text(self, candidate_data: Dict) -> str:
+        """Build the candidate work experience text compared against the job"""
+        # Extract experience from PDS structure
+        work_experience = candidate_data.get('work_experience', [])
+        experience = candidate_data.get('experience', [])  # Fallback to converted format
+        
+        experience_texts = []
+        
+        # Use PDS work_experience first
+        if work_experience and isinstance(work_experience, list):
+            for exp in work_experience[:4]:  # Top 4 experiences
+                if isinstance(exp, dict):
+                    position = exp.get('position', '')
+                    company = exp.get('company', '')
+                    grade = exp.get('grade', '')
+                    date_from = exp.get('date_from', '')
+                    date_to = exp.get('date_to', '')
+                    
+                    if position or company:
+                        exp_text = f"{position} at {company}"
+                        if grade and grade != 'N/A':
+                            exp_text += f" (Grade: {grade})"
+                        # Add date range for recency context
+                        if date_from or date_to:
+                            exp_text += f" ({date_from} to {date_to})"
+                        experience_texts.append(exp_text)
+        
+        # Fallback to converted experience format
+        elif experience:
+            for exp in experience[:4]:
+                if isinstance(exp, dict):
+                    position = exp.get('position', '')
+                    company = exp.get('company', '')
+                    description = exp.get('description', '')
+                    if position or description:
+                        exp_text = f"{position} - {description[:100]}".strip()
+                        experience_texts.append(exp_text)
+        
+        return " | ".join(experience_texts)
+    
     def _calculate_experience_relevance(self, candidate_data: Dict, job_data: Dict) -> float:
         """Calculate experience-specific relevance using PDS structure"""
         try:
-            # Extract experience from PDS structure
-            work_experience = candidate_data.get('work_experience', [])
-            experience = candidate_data.get('experience', [])  # Fallback to converted format
-            
-            experience_texts = []
-            
-            # Use PDS work_experience first
-            if work_experience and isinstance(work_experience, list):
-                for exp in work_experience[:4]:  # Top 4 experiences
-                    if isinstance(exp, dict):
-                        position = exp.get('position', '')
-                        company = exp.get('company', '')
-                        grade = exp.get('grade', '')
-                        date_from = exp.get('date_from', '')
-                        date_to = exp.get('date_to', '')
-                        
-                        if position or company:
-                            exp_text = f"{position} at {company}"
-                            if grade and grade != 'N/A':
-                                exp_text += f" (Grade: {grade})"
-                            # Add date range for recency context
-                            if date_from or date_to:
-                                exp_text += f" ({date_from} to {date_to})"
-                            experience_texts.append(exp_text)
-            
-            # Fallback to converted experience format
-            elif experience:
-                for exp in experience[:4]:
-                    if isinstance(exp, dict):
-                        position = exp.get('position', '')
-                        company = exp.get('company', '')
-                        description = exp.get('description', '')
-                        if position or description:
-                            exp_text = f"{position} - {description[:100]}".strip()
-                            experience_texts.append(exp_text)
+            candidate_exp_text = self.build_experience_text(candidate_data)
             
-            if not experience_texts:
+            if not candidate_exp_text:
                 return 0.0
             
             # Job requirements - focus on experience requirements
-            job_text = f"{job_data.get('title', '')} {job_data.get('description', '')} {job_data.get('requirements', '')}"
+            job_text = self.build_job_comparison_text(job_data, 'experience')
             
             # Calculate similarity
-            candidate_exp_text = " | ".join(experience_texts)
             exp_embedding = self.encode_text(candidate_exp_text, "experience")
-            job_embedding = self.encode_text(job_text, "job_exp_comparison")
+            job_embedding = self.encode_text(job_text, JOB_COMPARISON_CONTEXTS['experience'])
             
             if exp_embedding is None or job_embedding is None:
                 return 0.0
@@ -643,76 +792,81 @@ class UniversitySemanticEngine:
             logger.error(f"Failed to calculate experience relevance: {e}")
             return 0.0
     
+    def build_training_text(self, candidate_data: Dict) -> str:
+        """Build the candidate training text compared against the job"""
+        # Extract training/learning development from PDS structure
+        learning_development = candidate_data.get('learning_development', [])
+        training_programs = candidate_data.get('training_programs', [])  # PDS structure field
+        training = candidate_data.get('training', [])  # Fallback to converted format
+        
+        training_texts = []
+        
+        # Use PDS learning_development first
+        if learning_development:
+            for train in learning_development[:5]:  # Top 5 trainings
+                if isinstance(train, dict):
+                    title = train.get('title', '')
+                    type_info = train.get('type', '')
+                    conductor = train.get('conductor', '')
+                    hours = train.get('hours', '')
+                    
+                    if title:
+                        train_text = title
+                        if type_info and type_info != 'N/a':
+                            train_text += f" ({type_info})"
+                        if conductor:
+                            train_text += f" by {conductor}"
+                        if hours:
+                            train_text += f" - {hours} hours"
+                        training_texts.append(train_text)
+        
+        # Use PDS training_programs structure (primary PDS field)
+        elif training_programs:
+            for train in training_programs[:5]:  # Top 5 trainings
+                if isinstance(train, dict):
+                    title = train.get('title', '')
+                    type_info = train.get('type_of_ld', train.get('type', ''))  # Support both field names
+                    conductor = train.get('conducted_by', train.get('conductor', ''))
+                    hours = train.get('number_of_hours', train.get('hours', ''))
+                    
+                    if title:
+                        train_text = title
+                        if type_info and type_info not in ['N/a', '']:
+                            train_text += f" ({type_info})"
+                        if conductor:
+                            train_text += f" by {conductor}"
+                        if hours:
+                            train_text += f" - {hours} hours"
+                        training_texts.append(train_text)
+        
+        # Fallback to converted training format
+        elif training:
+            for train in training[:5]:
+                if isinstance(train, dict):
+                    title = train.get('title', '')
+                    type_info = train.get('type', '')
+                    if title:
+                        train_text = title
+                        if type_info:
+                            train_text += f" ({type_info})"
+                        training_texts.append(train_text)
+        
+        return " | ".join(training_texts)
+    
     def _calculate_training_relevance(self, candidate_data: Dict, job_data: Dict) -> float:
         """Calculate training and development relevance using PDS structure"""
         try:
-            # Extract training/learning development from PDS structure
-            learning_development = candidate_data.get('learning_development', [])
-            training_programs = candidate_data.get('training_programs', [])  # PDS structure field
-            training = candidate_data.get('training', [])  # Fallback to converted format
-            
-            training_texts = []
-            
-            # Use PDS learning_development first
-            if learning_development:
-                for train in learning_development[:5]:  # Top 5 trainings
-                    if isinstance(train, dict):
-                        title = train.get('title', '')
-                        type_info = train.get('type', '')
-                        conductor = train.get('conductor', '')
-                        hours = train.get('hours', '')
-                        
-                        if title:
-                            train_text = title
-                            if type_info and type_info != 'N/a':
-                                train_text += f" ({type_info})"
-                            if conductor:
-                                train_text += f" by {conductor}"
-                            if hours:
-                                train_text += f" - {hours} hours"
-                            training_texts.append(train_text)
-            
-            # Use PDS training_programs structure (primary PDS field)
-            elif training_programs:
-                for train in training_programs[:5]:  # Top 5 trainings
-                    if isinstance(train, dict):
-                        title = train.get('title', '')
-                        type_info = train.get('type_of_ld', train.get('type', ''))  # Support both field names
-                        conductor = train.get('conducted_by', train.get('conductor', ''))
-                        hours = train.get('number_of_hours', train.get('hours', ''))
-                        
-                        if title:
-                            train_text = title
-                            if type_info and type_info not in ['N/a', '']:
-                                train_text += f" ({type_info})"
-                            if conductor:
-                                train_text += f" by {conductor}"
-                            if hours:
-                                train_text += f" - {hours} hours"
-                            training_texts.append(train_text)
-            
-            # Fallback to converted training format
-            elif training:
-                for train in training[:5]:
-                    if isinstance(train, dict):
-                        title = train.get('title', '')
-                        type_info = train.get('type', '')
-                        if title:
-                            train_text = title
-                            if type_info:
-                                train_text += f" ({type_info})"
-                            training_texts.append(train_text)
+            candidate_training_text = self.build_training_text(candidate_data)
             
-            if not training_texts:
+            if not candidate_training_text:
                 return 0.0
             
             # Job requirements - focus on training/development needs
-            job_text = f"{job_data.get('title', '')} {job_data.get('description', '')} {job_data.get('requirements', '')}"
+            job_text = self.build_job_comparison_text(job_data, 'training')
             
             # Calculate similarity
-            candidate_training_text = " | ".join(training_texts)
             training_embedding = self.encode_text(candidate_training_text, "training")
-            job_embedding = self.encode_text(job_text, "job_training_comparison")
+            job_embedding = self.encode_text(job_text, JOB_COMPARISON_CONTEXTS['training'])
             
             if training_embedding is None or job_embedding is None:
                 return 0.0